@@ -62,6 +62,11 @@ def create_app(config_name=None):
     
     # Load configuration
     app.config.from_object(config[config_name])
+
+    # Serialize JSON responses with orjson when it is installed
+    from app.utils.serializers import ORJSON_AVAILABLE, OrjsonJSONProvider
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonJSONProvider(app)
     
     # Configure logging for anonymous access monitoring
     if not app.debug and not app.testing:
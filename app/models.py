@@ -1,6 +1,7 @@
 """Database models for Tennis Club Reservation System."""
 import uuid
 from datetime import datetime
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import UserMixin
 from app import db
@@ -106,8 +107,13 @@ class Member(db.Model, UserMixin):
                                    cascade='all, delete-orphan')
     
     def set_password(self, password):
-        """Hash and set the password."""
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        """Hash and set the password.
+
+        The hash method comes from PASSWORD_HASH_METHOD so tests can use a
+        cheap work factor; check_password reads the method from the hash.
+        """
+        method = current_app.config.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256')
+        self.password_hash = generate_password_hash(password, method=method)
     
     def check_password(self, password):
         """Check if the provided password matches the hash."""
@@ -295,6 +301,8 @@ class Reservation(db.Model):
         # Note: unique_booking constraint removed in favor of partial index
         # See migration for unique_active_booking partial index
         db.Index('idx_reservation_date', 'date'),
+        db.Index('idx_reservation_date_status', 'date', 'status'),
+        db.Index('idx_reservation_court_date', 'court_id', 'date'),
         db.Index('idx_reservation_booked_for', 'booked_for_id'),
         db.Index('idx_reservation_booked_by', 'booked_by_id'),
         db.Index('idx_reservation_short_notice', 'is_short_notice'),
@@ -4,20 +4,54 @@ API Courts Module
 Court availability for authenticated users (web and mobile).
 """
 
-from datetime import date, time, timedelta
+from datetime import time, timedelta
 from flask import request, jsonify, current_app
 from flask_login import current_user, login_user
 import jwt
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only
 
+from app import db
 from app.models import Court, Reservation, Block, Member
 from app.services.reservation_service import ReservationService
-from app.services.block_service import BlockService
 from app.services.validation_service import ValidationService
 from app.decorators.auth import jwt_or_session_required
+from app.utils.validators import parse_date_param
 from app import limiter
 from . import bp
 
+# Columns the availability builders read. Loading only these keeps the
+# reservation, block and joined member rows narrow; members in particular
+# carry many profile fields the grid never shows.
+AVAILABILITY_MEMBER_COLUMNS = (
+    Member.firstname, Member.lastname,
+    Member.has_profile_picture, Member.profile_picture_version
+)
+AVAILABILITY_RESERVATION_OPTIONS = (
+    load_only(
+        Reservation.court_id, Reservation.date, Reservation.start_time,
+        Reservation.end_time, Reservation.booked_for_id, Reservation.booked_by_id,
+        Reservation.status, Reservation.is_short_notice
+    ),
+    joinedload(Reservation.booked_for).load_only(*AVAILABILITY_MEMBER_COLUMNS),
+    joinedload(Reservation.booked_by).load_only(*AVAILABILITY_MEMBER_COLUMNS)
+)
+AVAILABILITY_BLOCK_OPTIONS = (
+    load_only(
+        Block.court_id, Block.date, Block.start_time, Block.end_time,
+        Block.reason_id, Block.details
+    ),
+    joinedload(Block.reason_obj)
+)
+
+def _get_courts():
+    """Get the ordered (id, number) rows of all courts.
+
+    Selects only the two columns the availability builders read instead of
+    full Court instances. Not cached: courts are written by the admin CLI in
+    another process, which the web workers would not notice.
+    """
+    return db.session.query(Court.id, Court.number).order_by(Court.number).all()
+
 
 def _handle_jwt_auth():
     """Check for JWT Bearer token or httpOnly cookie and log in user if valid.
@@ -56,7 +90,7 @@ def _build_day_availability(courts, reservation_map, block_map, suspended_map, c
     """Build sparse availability data for a single day.
 
     Args:
-        courts: List of Court objects
+        courts: Sequence of court objects with id and number (see _get_courts)
         reservation_map: Dict of (court_id, hour) -> Reservation for this date
         block_map: Dict of (court_id, hour) -> Block for this date
         suspended_map: Dict of (court_id, hour) -> suspended Reservation for this date
@@ -230,21 +264,22 @@ def get_availability():
     """
     from app.utils.timezone_utils import get_current_berlin_time
 
-    date_str = request.args.get('date', date.today().isoformat())
-    try:
-        query_date = date.fromisoformat(date_str)
-    except ValueError:
+    query_date = parse_date_param(request.args.get('date'))
+    if query_date is None:
         return jsonify({'error': 'Ungültiges Datumsformat'}), 400
 
     _handle_jwt_auth()
 
     current_time = get_current_berlin_time()
-    courts = Court.query.order_by(Court.number).all()
-    reservations = ReservationService.get_reservations_by_date(query_date)
-    blocks = BlockService.get_blocks_by_date(query_date)
-    suspended_reservations = Reservation.query.options(
-        joinedload(Reservation.booked_for)
-    ).filter(
+    courts = _get_courts()
+    reservations = Reservation.query.options(*AVAILABILITY_RESERVATION_OPTIONS).filter(
+        Reservation.date == query_date,
+        Reservation.status == 'active'
+    ).all()
+    blocks = Block.query.options(*AVAILABILITY_BLOCK_OPTIONS).filter(
+        Block.date == query_date
+    ).order_by(Block.start_time).all()
+    suspended_reservations = Reservation.query.options(*AVAILABILITY_RESERVATION_OPTIONS).filter(
         Reservation.date == query_date,
         Reservation.status == 'suspended'
     ).all()
@@ -257,7 +292,7 @@ def get_availability():
     )
 
     return jsonify({
-        'date': date_str,
+        'date': query_date.isoformat(),
         'current_hour': current_time.hour,
         'courts': courts_data,
         'metadata': {
@@ -296,9 +331,8 @@ def get_availability_range():
     if not start_str or not days_str:
         return jsonify({'error': 'Parameter start und days sind erforderlich'}), 400
 
-    try:
-        start_date = date.fromisoformat(start_str)
-    except ValueError:
+    start_date = parse_date_param(start_str)
+    if start_date is None:
         return jsonify({'error': 'Ungültiges Datumsformat für start'}), 400
 
     try:
@@ -313,28 +347,19 @@ def get_availability_range():
     current_time = get_current_berlin_time()
     end_date = start_date + timedelta(days=num_days - 1)
 
-    courts = Court.query.order_by(Court.number).all()
+    courts = _get_courts()
 
     # Batch fetch all data for the date range
-    reservations = Reservation.query.options(
-        joinedload(Reservation.booked_for),
-        joinedload(Reservation.booked_by),
-        joinedload(Reservation.court)
-    ).filter(
+    reservations = Reservation.query.options(*AVAILABILITY_RESERVATION_OPTIONS).filter(
         Reservation.date.between(start_date, end_date),
         Reservation.status == 'active'
     ).all()
 
-    blocks = Block.query.options(
-        joinedload(Block.reason_obj),
-        joinedload(Block.court)
-    ).filter(
+    blocks = Block.query.options(*AVAILABILITY_BLOCK_OPTIONS).filter(
         Block.date.between(start_date, end_date)
     ).all()
 
-    suspended_reservations = Reservation.query.options(
-        joinedload(Reservation.booked_for)
-    ).filter(
+    suspended_reservations = Reservation.query.options(*AVAILABILITY_RESERVATION_OPTIONS).filter(
         Reservation.date.between(start_date, end_date),
         Reservation.status == 'suspended'
     ).all()
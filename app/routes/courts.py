@@ -1,16 +1,31 @@
 """Court and availability routes."""
-from flask import Blueprint, render_template, jsonify, request, current_app
+from flask import Blueprint, Response, render_template, jsonify, request, current_app
 from flask_login import login_required, current_user
-from datetime import date, time, datetime
+from datetime import time, datetime
+import json
 import logging
 from app import db, limiter
 from app.models import Court, Block
 from app.services.reservation_service import ReservationService
 from app.services.block_service import BlockService
 from app.services.anonymous_filter_service import AnonymousDataFilter
+from app.utils.validators import parse_date_param
 
 bp = Blueprint('courts', __name__, url_prefix='/courts')
 
+# Rate limit responses have a fixed shape, so their JSON is built once and
+# only retry_after is serialized per response
+ANONYMOUS_RATE_LIMIT_BODY = '{"error":%s,"retry_after":%%s}\n' % json.dumps(
+    'Zu viele Anfragen. Versuch es später nochmal.'
+)
+RATE_LIMIT_BODY = json.dumps({'error': 'Rate limit exceeded'}) + '\n'
+
+# Time slots from 08:00 to 22:00 (14 slots: 08:00-09:00, 09:00-10:00, ..., 21:00-22:00)
+# with their display labels, built once instead of on every grid request
+TIME_SLOTS = tuple(time(hour, 0) for hour in range(8, 22))
+TIME_SLOT_LABELS = {slot_time: slot_time.strftime('%H:%M') for slot_time in TIME_SLOTS}
+TIME_SLOTS_BY_LABEL = {label: slot_time for slot_time, label in TIME_SLOT_LABELS.items()}
+
 
 def _is_slot_in_past(slot_time, query_date, current_time):
     """Check if a time slot is in the past."""
@@ -140,18 +155,20 @@ def ratelimit_handler(e):
             f"Rate limit exceeded for anonymous user - IP: {request.remote_addr}, "
             f"Endpoint: {request.endpoint}, User-Agent: {request.headers.get('User-Agent', 'Unknown')}"
         )
-        return jsonify({
-            'error': 'Zu viele Anfragen. Versuch es später nochmal.',
-            'retry_after': e.retry_after
-        }), 429
-    return jsonify({'error': 'Rate limit exceeded'}), 429
+        body = ANONYMOUS_RATE_LIMIT_BODY % json.dumps(e.retry_after)
+        return Response(body, mimetype='application/json'), 429
+    return Response(RATE_LIMIT_BODY, mimetype='application/json'), 429
 
 
 @bp.route('/', methods=['GET'])
 @login_required
 def list_courts():
-    """List all courts."""
-    courts = Court.query.order_by(Court.number).all()
+    """List all courts.
+
+    Reads the courts straight from the database so status changes made by
+    the admin CLI show up immediately in every worker.
+    """
+    courts = db.session.query(Court.id, Court.number, Court.status).order_by(Court.number).all()
     return jsonify({
         'courts': [
             {
@@ -182,10 +199,8 @@ def get_availability():
             user_agent=request.headers.get('User-Agent')
         )
     
-    date_str = request.args.get('date', date.today().isoformat())
-    try:
-        query_date = date.fromisoformat(date_str)
-    except ValueError:
+    query_date = parse_date_param(request.args.get('date'))
+    if query_date is None:
         return jsonify({'error': 'Ungültiges Datumsformat'}), 400
     
     # Detect authentication status
@@ -205,10 +220,18 @@ def get_availability():
     blocks = BlockService.get_blocks_by_date(query_date)
     
     # Build availability grid
-    # Time slots from 08:00 to 22:00 (14 slots: 08:00-09:00, 09:00-10:00, ..., 21:00-22:00)
-    time_slots = []
-    for hour in range(8, 22):
-        time_slots.append(time(hour, 0))
+    # Index blocks and reservations by (court_id, slot) so each cell is a
+    # dict lookup instead of a scan; the first match wins as before
+    block_map = {}
+    for block in blocks:
+        for slot_time in TIME_SLOTS:
+            if block.start_time <= slot_time < block.end_time:
+                block_map.setdefault((block.court_id, slot_time), block)
+
+    reservation_map = {}
+    for reservation in reservations:
+        if reservation.status == 'active':
+            reservation_map.setdefault((reservation.court_id, reservation.start_time), reservation)
     
     grid = []
     for court in courts:
@@ -218,53 +241,47 @@ def get_availability():
             'slots': []
         }
         
-        for slot_time in time_slots:
+        for slot_time in TIME_SLOTS:
             slot = {
-                'time': slot_time.strftime('%H:%M'),
+                'time': TIME_SLOT_LABELS[slot_time],
                 'status': 'available',
                 'details': None
             }
             
+            key = (court.id, slot_time)
+
             # Check if blocked
-            for block in blocks:
-                if (block.court_id == court.id and
-                    block.start_time <= slot_time < block.end_time):
-                    slot['status'] = 'blocked'
-                    slot['details'] = {
-                        'reason': block.reason_obj.name if block.reason_obj else 'Unbekannt',
-                        'details': block.details if block.details else '',
-                        'block_id': block.id
-                    }
-                    break
+            block = block_map.get(key)
+            if block is not None:
+                slot['status'] = 'blocked'
+                slot['details'] = {
+                    'reason': block.reason_obj.name if block.reason_obj else 'Unbekannt',
+                    'details': block.details if block.details else '',
+                    'block_id': block.id
+                }
             
             # Check if reserved (only if not blocked)
-            if slot['status'] == 'available':
-                for reservation in reservations:
-                    if (reservation.court_id == court.id and 
-                        reservation.start_time == slot_time and
-                        reservation.status == 'active'):
-                        
-                        # Use time-based logic to determine if reservation is still active
-                        is_reservation_active = ReservationService.is_reservation_currently_active(reservation, current_time)
-                        
-                        # Only show as reserved if the reservation is still active
-                        if is_reservation_active:
-                            # Set status based on whether it's a short notice booking
-                            slot['status'] = 'short_notice' if reservation.is_short_notice else 'reserved'
-                            slot['details'] = {
-                                'booked_for': f"{reservation.booked_for.firstname} {reservation.booked_for.lastname}",
-                                'booked_for_id': reservation.booked_for_id,
-                                'booked_by': f"{reservation.booked_by.firstname} {reservation.booked_by.lastname}",
-                                'booked_by_id': reservation.booked_by_id,
-                                'reservation_id': reservation.id,
-                                'is_short_notice': reservation.is_short_notice,
-                                'is_active': is_reservation_active,
-                                'booking_status': 'active'
-                            }
-                        else:
-                            # Reservation has ended, slot becomes available
-                            slot['status'] = 'available'
-                        break
+            elif key in reservation_map:
+                reservation = reservation_map[key]
+
+                # Use time-based logic to determine if reservation is still active
+                is_reservation_active = ReservationService.is_reservation_currently_active(reservation, current_time)
+                
+                # Only show as reserved if the reservation is still active;
+                # otherwise the reservation has ended and the slot stays available
+                if is_reservation_active:
+                    # Set status based on whether it's a short notice booking
+                    slot['status'] = 'short_notice' if reservation.is_short_notice else 'reserved'
+                    slot['details'] = {
+                        'booked_for': f"{reservation.booked_for.firstname} {reservation.booked_for.lastname}",
+                        'booked_for_id': reservation.booked_for_id,
+                        'booked_by': f"{reservation.booked_by.firstname} {reservation.booked_by.lastname}",
+                        'booked_by_id': reservation.booked_by_id,
+                        'reservation_id': reservation.id,
+                        'is_short_notice': reservation.is_short_notice,
+                        'is_active': is_reservation_active,
+                        'booking_status': 'active'
+                    }
             
             court_data['slots'].append(slot)
         
@@ -278,7 +295,7 @@ def get_availability():
     current_user_id = current_user.id if is_authenticated else None
     for court_data in filtered_grid:
         for slot in court_data['slots']:
-            slot_time = time.fromisoformat(slot['time'])
+            slot_time = TIME_SLOTS_BY_LABEL[slot['time']]
             is_past = _is_slot_in_past(slot_time, query_date, current_time)
 
             slot['cssClass'] = _compute_slot_class(
@@ -294,7 +311,7 @@ def get_availability():
 
     # Add metadata about real-time updates
     response_data = {
-        'date': date_str,
+        'date': query_date.isoformat(),
         'grid': filtered_grid,
         'metadata': {
             'generated_at': current_time.isoformat(),
@@ -324,10 +341,8 @@ def get_realtime_availability():
             user_agent=request.headers.get('User-Agent')
         )
     
-    date_str = request.args.get('date', date.today().isoformat())
-    try:
-        query_date = date.fromisoformat(date_str)
-    except ValueError:
+    query_date = parse_date_param(request.args.get('date'))
+    if query_date is None:
         return jsonify({'error': 'Ungültiges Datumsformat'}), 400
     
     # Get current time for real-time calculations
@@ -341,7 +356,7 @@ def get_realtime_availability():
     reservations = ReservationService.get_reservations_by_date(query_date)
     
     # Calculate availability statistics using active booking session logic
-    total_slots = len(courts) * 14  # 6 courts * 14 time slots (08:00-22:00)
+    total_slots = len(courts) * len(TIME_SLOTS)  # 6 courts * 14 time slots (08:00-22:00)
     active_reservations = 0
     past_reservations = 0
     short_notice_active = 0
@@ -363,7 +378,7 @@ def get_realtime_availability():
     available_slots = total_slots - active_reservations - blocked_slots
     
     return jsonify({
-        'date': date_str,
+        'date': query_date.isoformat(),
         'current_time': current_time.isoformat(),
         'availability_summary': {
             'total_slots': total_slots,
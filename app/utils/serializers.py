@@ -1,6 +1,16 @@
 """JSON serialization utilities."""
 from datetime import datetime, date, time
 
+from flask.json.provider import DefaultJSONProvider
+
+# orjson is optional: without it Flask's standard provider is used
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 
 def serialize_for_json(value):
     """
@@ -19,3 +29,27 @@ def serialize_for_json(value):
     if isinstance(value, (list, tuple)):
         return [serialize_for_json(v) for v in value]
     return value
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes compact output with orjson.
+
+    Output matches the default provider: keys stay sorted, non-string keys
+    are converted, and dates still go through the provider's ``default``
+    (HTTP date format). Only non-ASCII text differs, written as UTF-8
+    instead of \\u escapes. Calls that ask for other formatting, such as
+    indented debug output, and anything orjson rejects fall back to the
+    standard library.
+    """
+
+    def dumps(self, obj, **kwargs):
+        if set(kwargs) - {'separators'} or kwargs.get('separators', (',', ':')) != (',', ':'):
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
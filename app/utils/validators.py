@@ -1,4 +1,5 @@
 """Input validation utilities."""
+import re
 import uuid as uuid_module
 from datetime import datetime, date, time
 from functools import wraps
@@ -50,6 +51,31 @@ def validate_date_format(date_str, field_name="date"):
         raise ValidationError(f"Ungültiges Datumsformat für {field_name}. Erwartet: YYYY-MM-DD")
 
 
+# Cheap format pre-check so obvious garbage is rejected without an exception
+DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+
+def parse_date_param(value):
+    """
+    Parse an optional date query parameter in YYYY-MM-DD format.
+    
+    Args:
+        value: Parameter value, or None if the parameter was not given
+        
+    Returns:
+        date: Parsed date, today's date if value is None, or None if the
+        value is not a valid date
+    """
+    if value is None:
+        return date.today()
+    if not DATE_PATTERN.fullmatch(value):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def validate_time_format(time_str, field_name="time"):
     """
     Validate and parse time string in HH:MM format.
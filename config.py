@@ -57,6 +57,9 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
 
+    # Password hashing (werkzeug method string, see Member.set_password)
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256'
+
     # Session
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
@@ -150,10 +153,16 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
+    # In-memory SQLite: commits never touch disk, so no journal/synchronous
+    # PRAGMA tuning is needed. Flask-SQLAlchemy serves it from a single
+    # StaticPool connection, which tests/conftest.py relies on for snapshots.
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
     MAIL_SUPPRESS_SEND = True
     RATELIMIT_ENABLED = False
+
+    # Single PBKDF2 iteration: same hashing code path, negligible CPU cost
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'
     
     # Override booking hours for testing to match test expectations
     BOOKING_START_HOUR = 6
@@ -0,0 +1,28 @@
+"""Add composite indexes for reservation lookups by day
+
+Revision ID: f7a8b9c0d1e2
+Revises: 328dba4efb56
+Create Date: 2026-10-17
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a8b9c0d1e2'
+down_revision = '328dba4efb56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Availability reads all active/suspended reservations of a day;
+    # conflict checks look up one court on one day (like idx_block_court_date)
+    op.create_index('idx_reservation_date_status', 'reservation', ['date', 'status'], unique=False)
+    op.create_index('idx_reservation_court_date', 'reservation', ['court_id', 'date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_reservation_court_date', table_name='reservation')
+    op.drop_index('idx_reservation_date_status', table_name='reservation')
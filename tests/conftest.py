@@ -10,66 +10,298 @@ Example usage in tests:
     admin = MemberFactory(admin=True)           # Admin user
     member = MemberFactory(email='custom@x.com') # Override fields
 """
+import os
+import sqlite3
+from contextlib import contextmanager
+
 import pytest
+from hypothesis import HealthCheck, settings
 from app import create_app, db
 from app.models import Member, Court, BlockReason
+from flask import g
 from flask_mailman import Mail
-from tests.factories import MemberFactory, CourtFactory, BlockReasonFactory
+from tests.factories import MemberFactory, CourtFactory, BlockReasonFactory, hash_password
 
 
-@pytest.fixture
-def app():
-    """Create application for testing.
+# Hypothesis profiles, selected with HYPOTHESIS_PROFILE (default: dev).
+# "dev" runs a handful of examples per property for a fast local loop and
+# keeps the example database in .hypothesis/ so failing examples are
+# replayed first on the next run. "ci" runs the full 100 examples derived
+# from each test instead of a random seed, so every CI run checks the same
+# inputs. Hypothesis disables the example database for derandomized runs.
+# Both profiles drop the deadline (examples hit the database) and allow the
+# function-scoped ``app`` fixture, which property tests reset per example.
+# Tests that set max_examples in their own @settings keep that value.
+_common_hypothesis_settings = dict(
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+settings.register_profile('dev', max_examples=10, **_common_hypothesis_settings)
+settings.register_profile('ci', max_examples=100, derandomize=True, **_common_hypothesis_settings)
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'dev'))
+
+
+def _seed_default_data():
+    """Insert the fixed setup data every test starts with.
 
-    Pre-creates:
     - 6 courts (numbers 1-6)
     - System admin (system@example.com)
     - 5 default block reasons
     """
-    app = create_app('testing')
+    # Create courts (use direct creation for fixed setup data)
+    for i in range(1, 7):
+        court = Court(number=i)
+        db.session.add(court)
 
-    with app.app_context():
+    # Create a default admin for block reasons
+    admin = Member(
+        firstname='System',
+        lastname='Admin',
+        email='system@example.com',
+        role='administrator'
+    )
+    admin.set_password('admin123')
+    db.session.add(admin)
+    db.session.commit()
+
+    # Create default block reasons
+    default_reasons = ['Maintenance', 'Weather', 'Tournament', 'Championship', 'Tennis Course']
+    for reason_name in default_reasons:
+        reason = BlockReason(
+            name=reason_name,
+            is_active=True,
+            created_by_id=admin.id
+        )
+        db.session.add(reason)
+
+    db.session.commit()
+
+
+@pytest.fixture(scope='session')
+def db_snapshot():
+    """Build the seeded test database once and keep it as an SQLite snapshot.
+
+    Copying the snapshot into a fresh in-memory database with the SQLite
+    backup API is much cheaper than running DDL and seeding for every test.
+    Under pytest-xdist every worker is its own process and therefore gets
+    its own private in-memory database.
+    """
+    snapshot_app = create_app('testing')
+
+    with snapshot_app.app_context():
         db.create_all()
+        _seed_default_data()
+        snapshot = _take_snapshot()
+        db.session.remove()
+        db.engine.dispose()
 
-        # Create courts (use direct creation for fixed setup data)
-        for i in range(1, 7):
-            court = Court(number=i)
-            db.session.add(court)
+    yield snapshot
+    snapshot.close()
 
-        # Create a default admin for block reasons
-        admin = Member(
-            firstname='System',
-            lastname='Admin',
-            email='system@example.com',
-            role='administrator'
-        )
-        admin.set_password('admin123')
-        db.session.add(admin)
-        db.session.commit()
 
-        # Create default block reasons
-        default_reasons = ['Maintenance', 'Weather', 'Tournament', 'Championship', 'Tennis Course']
-        for reason_name in default_reasons:
-            reason = BlockReason(
-                name=reason_name,
-                is_active=True,
-                created_by_id=admin.id
-            )
-            db.session.add(reason)
+@pytest.fixture(scope='session')
+def block_reason_ids(db_snapshot):
+    """Map each seeded block reason name to its ID.
+
+    Every test starts from the same snapshot, so these IDs are valid in all
+    of them and tests do not need to look the reasons up again.
+    """
+    return dict(db_snapshot.execute('SELECT name, id FROM block_reason'))
 
-        db.session.commit()
+
+@pytest.fixture(scope='session')
+def court_ids(db_snapshot):
+    """Map each seeded court number (1-6) to its ID.
+
+    Saves tests a Court query just to find a court to book or block.
+    """
+    return dict(db_snapshot.execute('SELECT number, id FROM court'))
+
+
+@pytest.fixture(scope='session')
+def system_admin_id(db_snapshot):
+    """ID of the seeded system admin (system@example.com).
+
+    Lets tests that only need some administrator act as this one instead of
+    creating and hashing a password for their own.
+    """
+    row = db_snapshot.execute(
+        "SELECT id FROM member WHERE email = 'system@example.com'"
+    ).fetchone()
+    return row[0]
+
+
+def _take_snapshot():
+    """Copy the current app's database into a new in-memory SQLite connection."""
+    snapshot = sqlite3.connect(':memory:', check_same_thread=False)
+    raw = db.engine.raw_connection()
+    try:
+        raw.driver_connection.backup(snapshot)
+    finally:
+        raw.close()
+    return snapshot
+
+
+def _restore_snapshot(db_snapshot):
+    """Replace the current app's database contents with the snapshot.
+
+    In-memory SQLite uses a single StaticPool connection, so restoring into
+    it resets the database every session in this app will see.
+    """
+    raw = db.engine.raw_connection()
+    try:
+        db_snapshot.backup(raw.driver_connection)
+    finally:
+        raw.close()
+
+
+def _create_test_app(db_snapshot):
+    """Create a testing app whose database is restored from the snapshot.
+
+    Yields the app with its app context pushed and drops the database
+    afterwards.
+    """
+    app = create_app('testing')
+
+    with app.app_context():
+        _restore_snapshot(db_snapshot)
 
         yield app
         db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture(scope='session')
+def session_app():
+    """Create the application once for the whole test session.
+
+    Building the app (config, extensions, blueprints) is the same for every
+    test; only the database needs resetting, which the ``app`` fixture does.
+    """
+    return create_app('testing')
+
+
+@pytest.fixture
+def app(session_app, db_snapshot):
+    """Provide the application for a test with a freshly reset database.
+
+    The database is restored from the session-wide snapshot, so it
+    pre-contains:
+    - 6 courts (numbers 1-6)
+    - System admin (system@example.com)
+    - 5 default block reasons
+
+    Rows written by the test are discarded by the next restore.
+    """
+    with session_app.app_context():
+        _restore_snapshot(db_snapshot)
+
+        yield session_app
+        db.session.remove()
+
+
+@pytest.fixture
+def db_checkpoint(app):
+    """Capture the current database state so it can be restored repeatedly.
+
+    Calling the fixture value snapshots the database and returns a function
+    that resets it to that point. Hypothesis examples share one ``app``, so
+    property tests seed once, take a checkpoint and restore it after every
+    example instead of deleting their rows one by one.
+    """
+    snapshots = []
+
+    def capture():
+        snapshot = _take_snapshot()
+        snapshots.append(snapshot)
+
+        def restore():
+            db.session.remove()
+            _restore_snapshot(snapshot)
+
+        return restore
+
+    yield capture
+    for snapshot in snapshots:
+        snapshot.close()
+
+
+@pytest.fixture
+def example_db(db_checkpoint):
+    """Return a context manager that resets the database when it exits.
+
+    Hypothesis examples share one ``app``, so each property test wraps its
+    example in it instead of deleting the rows it created. The checkpoint
+    is taken when the first example starts, after any seeding fixtures ran,
+    so rows they created survive every reset and need no unique emails.
+    """
+    restore = None
+
+    @contextmanager
+    def scope():
+        nonlocal restore
+        if restore is None:
+            restore = db_checkpoint()
+        try:
+            yield
+        finally:
+            restore()
+
+    return scope
+
+
+@pytest.fixture
+def fresh_app(db_snapshot):
+    """Create a brand-new application for a single test.
+
+    Use this when a test must change the app itself (e.g. register extra
+    routes), which the shared session app no longer allows once it has
+    handled a request. Same seed data as ``app``.
+    """
+    yield from _create_test_app(db_snapshot)
+
+
+@pytest.fixture(scope='class')
+def class_app(db_snapshot):
+    """Create an application shared by all tests of a class.
+
+    Same seed data as ``app``. Meant for classes whose tests only read the
+    state built by a class-scoped fixture, so the setup runs once per class.
+    """
+    yield from _create_test_app(db_snapshot)
+
+
 @pytest.fixture
 def client(app):
     """Create test client."""
     return app.test_client()
 
 
+@pytest.fixture
+def login_as(client):
+    """Return a function that logs ``client`` in as the given member ID.
+
+    Writes the Flask-Login session directly, skipping the /auth/login round
+    trip for tests that need an authenticated session but do not exercise
+    the login route itself.
+    """
+    def login(member_id):
+        with client.session_transaction() as sess:
+            sess['_user_id'] = member_id
+            sess['_fresh'] = True
+        # Requests share the test's app context, so drop any user an
+        # earlier request left cached on g
+        g.pop('_login_user', None)
+    return login
+
+
+@pytest.fixture
+def logged_in_client(client, test_member, login_as):
+    """Create test client that is already logged in as ``test_member``."""
+    login_as(test_member.id)
+    return client
+
+
 @pytest.fixture
 def runner(app):
     """Create test CLI runner."""
@@ -132,7 +364,7 @@ def test_admin(app):
             email='admin@example.com',
         )
         # Override default password for backward compatibility with existing tests
-        admin.set_password('admin123')
+        admin.password_hash = hash_password('admin123')
         db.session.commit()
         return MemberData(
             id=admin.id,
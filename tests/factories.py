@@ -1,9 +1,11 @@
 """Factory Boy factories for test data generation."""
 import uuid
 from datetime import date, time
+from functools import lru_cache
 
 import factory
 from factory.alchemy import SQLAlchemyModelFactory
+from flask import current_app
 from werkzeug.security import generate_password_hash
 
 from app import db
@@ -13,6 +15,20 @@ from app.models import (
 )
 
 
+@lru_cache(maxsize=None)
+def _cached_password_hash(password, method):
+    return generate_password_hash(password, method=method)
+
+
+def hash_password(password):
+    """Return a password hash for test members, computed once per password.
+
+    The salt is irrelevant in tests, so every member with the same password
+    can share one hash. Member.check_password still verifies it normally.
+    """
+    return _cached_password_hash(password, current_app.config['PASSWORD_HASH_METHOD'])
+
+
 class BaseFactory(SQLAlchemyModelFactory):
     """Base factory with SQLAlchemy session configuration."""
 
@@ -46,7 +62,7 @@ class MemberFactory(BaseFactory):
     @factory.lazy_attribute
     def password_hash(self):
         """Generate password hash for default password 'password123'."""
-        return generate_password_hash('password123', method='pbkdf2:sha256')
+        return hash_password('password123')
 
     class Params:
         admin = factory.Trait(
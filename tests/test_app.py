@@ -1,6 +1,9 @@
 """Test Flask application factory."""
 import pytest
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
 from app import create_app
+from app.utils.serializers import ORJSON_AVAILABLE, OrjsonJSONProvider
 
 
 def test_app_creation():
@@ -20,3 +23,23 @@ def test_app_config_production():
     """Test production configuration."""
     app = create_app('production')
     assert app.config['DEBUG'] is False
+
+
+def test_fast_password_hashing_only_in_testing():
+    """Test that the cheap test hash method never leaks into other configs."""
+    assert create_app('testing').config['PASSWORD_HASH_METHOD'] == 'pbkdf2:sha256:1'
+    assert create_app('development').config['PASSWORD_HASH_METHOD'] == 'pbkdf2:sha256'
+    assert create_app('production').config['PASSWORD_HASH_METHOD'] == 'pbkdf2:sha256'
+
+
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason='orjson not installed')
+def test_orjson_provider_matches_default_output(app):
+    """Test the orjson provider produces the same compact JSON as Flask's default."""
+    payload = {'b': date(2026, 12, 5), 'a': [1, 'x'], 'c': None}
+    assert isinstance(app.json, OrjsonJSONProvider)
+    default = DefaultJSONProvider(app)
+    assert app.json.dumps(payload, separators=(',', ':')) == default.dumps(payload, separators=(',', ':'))
+    # Indented output is left to the standard library
+    assert app.json.dumps(payload, indent=2) == default.dumps(payload, indent=2)
+    # Non-ASCII text is written as UTF-8 instead of \u escapes
+    assert app.json.loads(app.json.dumps({'error': 'Ungültiges Datum'})) == {'error': 'Ungültiges Datum'}
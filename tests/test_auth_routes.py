@@ -1,8 +1,17 @@
 """Tests for authentication routes."""
+import re
+
 import pytest
 from flask import url_for
-from app import db
-from app.models import Member
+from tests.factories import MemberFactory
+
+
+# Case-insensitive patterns searched directly in the response body, so the
+# rendered page is not lowercased into a copy for every assertion
+LOGIN_PAGE_RE = re.compile(rb'login|anmelden', re.I)
+LOGIN_ERROR_RE = re.compile(rb'falsch|error', re.I)
+WRONG_PASSWORD_RE = re.compile(rb'falsch', re.I)
+DEACTIVATED_RE = re.compile(rb'deaktiviert', re.I)
 
 
 class TestLogin:
@@ -12,17 +21,11 @@ class TestLogin:
         """Login page should render for unauthenticated users."""
         response = client.get('/auth/login')
         assert response.status_code == 200
-        assert b'login' in response.data.lower() or b'anmelden' in response.data.lower()
+        assert LOGIN_PAGE_RE.search(response.data)
 
-    def test_login_redirects_authenticated_user(self, client, test_member):
+    def test_login_redirects_authenticated_user(self, logged_in_client):
         """Authenticated users should be redirected from login page."""
-        # Login first
-        client.post('/auth/login', data={
-            'email': test_member.email,
-            'password': 'password123'
-        })
-        # Try to access login page again
-        response = client.get('/auth/login', follow_redirects=False)
+        response = logged_in_client.get('/auth/login', follow_redirects=False)
         assert response.status_code == 302
 
     def test_login_success(self, client, test_member):
@@ -33,58 +36,70 @@ class TestLogin:
         }, follow_redirects=True)
         assert response.status_code == 200
 
-    def test_login_invalid_email(self, client):
-        """Invalid email should show error."""
+    @pytest.mark.parametrize('email, password, shows_error', [
+        pytest.param('nonexistent@example.com', 'password123', True, id='unknown_email'),
+        pytest.param('test@example.com', 'wrongpassword', True, id='wrong_password'),
+        pytest.param('', 'password123', False, id='empty_email'),
+        pytest.param('test@example.com', '', False, id='empty_password'),
+        pytest.param(None, 'password123', False, id='missing_email'),
+        pytest.param('test@example.com', None, False, id='missing_password'),
+    ])
+    def test_login_bad_inputs(self, client, test_member, email, password, shows_error):
+        """Bad or missing credentials should re-render the login form.
+
+        A value of None leaves the field out of the submitted form.
+        """
+        form = {'email': email, 'password': password}
         response = client.post('/auth/login', data={
-            'email': 'nonexistent@example.com',
-            'password': 'password123'
+            field: value for field, value in form.items() if value is not None
         })
         assert response.status_code == 200
-        assert b'falsch' in response.data.lower() or b'error' in response.data.lower()
+        if shows_error:
+            assert LOGIN_ERROR_RE.search(response.data)
+
+    def test_login_deactivated_account(self, client):
+        """Deactivated accounts should not be able to login."""
+        MemberFactory(
+            inactive=True,
+            firstname='Inactive',
+            lastname='User',
+            email='inactive@example.com',
+        )
 
-    def test_login_invalid_password(self, client, test_member):
-        """Invalid password should show error."""
         response = client.post('/auth/login', data={
-            'email': test_member.email,
-            'password': 'wrongpassword'
+            'email': 'inactive@example.com',
+            'password': 'password123'
         })
         assert response.status_code == 200
-        assert b'falsch' in response.data.lower() or b'error' in response.data.lower()
+        assert DEACTIVATED_RE.search(response.data)
 
-    def test_login_deactivated_account(self, client, app):
-        """Deactivated accounts should not be able to login."""
-        with app.app_context():
-            member = Member(
-                firstname='Inactive',
-                lastname='User',
-                email='inactive@example.com',
-                role='member',
-                is_active=False
-            )
-            member.set_password('password123')
-            db.session.add(member)
-            db.session.commit()
+    def test_login_deactivated_account_wrong_password(self, client):
+        """Deactivated status is only revealed after the password matched.
+
+        The account state checks run after check_password, so these negative
+        paths need a real password hash and cannot use a sentinel value.
+        """
+        MemberFactory(
+            inactive=True,
+            email='inactive@example.com',
+        )
 
         response = client.post('/auth/login', data={
             'email': 'inactive@example.com',
-            'password': 'password123'
+            'password': 'wrongpassword'
         })
         assert response.status_code == 200
-        assert b'deaktiviert' in response.data.lower()
+        assert WRONG_PASSWORD_RE.search(response.data)
+        assert not DEACTIVATED_RE.search(response.data)
 
-    def test_login_sustaining_member_blocked(self, client, app):
+    def test_login_sustaining_member_blocked(self, client):
         """Sustaining members should not be able to login."""
-        with app.app_context():
-            member = Member(
-                firstname='Sustaining',
-                lastname='Member',
-                email='sustaining@example.com',
-                role='member',
-                membership_type='sustaining'
-            )
-            member.set_password('password123')
-            db.session.add(member)
-            db.session.commit()
+        MemberFactory(
+            sustaining=True,
+            firstname='Sustaining',
+            lastname='Member',
+            email='sustaining@example.com',
+        )
 
         response = client.post('/auth/login', data={
             'email': 'sustaining@example.com',
@@ -93,23 +108,6 @@ class TestLogin:
         assert response.status_code == 200
         # Should show error about sustaining members
 
-    def test_login_missing_email(self, client):
-        """Missing email should show validation error."""
-        response = client.post('/auth/login', data={
-            'email': '',
-            'password': 'password123'
-        })
-        assert response.status_code == 200
-
-    def test_login_missing_password(self, client, test_member):
-        """Missing password should show validation error."""
-        response = client.post('/auth/login', data={
-            'email': test_member.email,
-            'password': ''
-        })
-        assert response.status_code == 200
-
-
 class TestLoginApi:
     """Tests for API login endpoint."""
 
@@ -130,33 +128,33 @@ class TestLoginApi:
         # Flask returns 415 Unsupported Media Type when Content-Type is not application/json
         assert response.status_code in [400, 415]
 
-    def test_api_login_missing_credentials(self, client):
-        """API login should require email and password."""
-        response = client.post('/auth/login/api', json={'email': ''})
-        assert response.status_code == 400
-        assert 'erforderlich' in response.get_json()['error']
-
-    def test_api_login_invalid_credentials(self, client):
-        """API login should reject invalid credentials."""
-        response = client.post('/auth/login/api',
-            json={'email': 'nonexistent@example.com', 'password': 'wrong'}
-        )
-        assert response.status_code == 401
-        assert 'falsch' in response.get_json()['error']
+    @pytest.mark.parametrize('email, password, status_code, error_text', [
+        pytest.param('', None, 400, 'erforderlich', id='empty_email'),
+        pytest.param('test@example.com', '', 400, 'erforderlich', id='empty_password'),
+        pytest.param('test@example.com', None, 400, 'erforderlich', id='missing_password'),
+        pytest.param('nonexistent@example.com', 'wrong', 401, 'falsch', id='unknown_email'),
+        pytest.param('test@example.com', 'wrong', 401, 'falsch', id='wrong_password'),
+    ])
+    def test_api_login_bad_inputs(self, client, test_member, email, password, status_code, error_text):
+        """API login should reject missing or invalid credentials.
+
+        A value of None leaves the field out of the JSON body.
+        """
+        payload = {'email': email, 'password': password}
+        response = client.post('/auth/login/api', json={
+            field: value for field, value in payload.items() if value is not None
+        })
+        assert response.status_code == status_code
+        assert error_text in response.get_json()['error']
 
-    def test_api_login_deactivated_account(self, client, app):
+    def test_api_login_deactivated_account(self, client):
         """API login should reject deactivated accounts."""
-        with app.app_context():
-            member = Member(
-                firstname='Inactive',
-                lastname='Api',
-                email='inactive_api@example.com',
-                role='member',
-                is_active=False
-            )
-            member.set_password('password123')
-            db.session.add(member)
-            db.session.commit()
+        MemberFactory(
+            inactive=True,
+            firstname='Inactive',
+            lastname='Api',
+            email='inactive_api@example.com',
+        )
 
         response = client.post('/auth/login/api',
             json={'email': 'inactive_api@example.com', 'password': 'password123'}
@@ -164,19 +162,14 @@ class TestLoginApi:
         assert response.status_code == 403
         assert 'deaktiviert' in response.get_json()['error']
 
-    def test_api_login_sustaining_member_blocked(self, client, app):
+    def test_api_login_sustaining_member_blocked(self, client):
         """API login should block sustaining members."""
-        with app.app_context():
-            member = Member(
-                firstname='Sustaining',
-                lastname='Api',
-                email='sustaining_api@example.com',
-                role='member',
-                membership_type='sustaining'
-            )
-            member.set_password('password123')
-            db.session.add(member)
-            db.session.commit()
+        MemberFactory(
+            sustaining=True,
+            firstname='Sustaining',
+            lastname='Api',
+            email='sustaining_api@example.com',
+        )
 
         response = client.post('/auth/login/api',
             json={'email': 'sustaining_api@example.com', 'password': 'password123'}
@@ -187,24 +180,14 @@ class TestLoginApi:
 class TestLogout:
     """Tests for logout functionality."""
 
-    def test_logout(self, client, test_member):
+    def test_logout(self, logged_in_client):
         """Logout should redirect to dashboard."""
-        # Login first
-        client.post('/auth/login', data={
-            'email': test_member.email,
-            'password': 'password123'
-        })
-        # Logout
-        response = client.get('/auth/logout', follow_redirects=False)
+        response = logged_in_client.get('/auth/logout', follow_redirects=False)
         assert response.status_code == 302
 
-    def test_logout_shows_message(self, client, test_member):
+    def test_logout_shows_message(self, logged_in_client):
         """Logout should show success message."""
-        client.post('/auth/login', data={
-            'email': test_member.email,
-            'password': 'password123'
-        })
-        response = client.get('/auth/logout', follow_redirects=True)
+        response = logged_in_client.get('/auth/logout', follow_redirects=True)
         assert response.status_code == 200
 
 
@@ -221,26 +204,16 @@ class TestEmailVerification:
         response = client.post('/auth/resend-verification')
         assert response.status_code == 401
 
-    def test_resend_verification_already_verified(self, client, app):
+    def test_resend_verification_already_verified(self, client, login_as):
         """Already verified users should get error when resending."""
-        with app.app_context():
-            member = Member(
-                firstname='Verified',
-                lastname='User',
-                email='verified@example.com',
-                role='member',
-                email_verified=True
-            )
-            member.set_password('password123')
-            db.session.add(member)
-            db.session.commit()
-            member_email = member.email
-
-        # Login
-        client.post('/auth/login', data={
-            'email': member_email,
-            'password': 'password123'
-        })
+        member = MemberFactory(
+            firstname='Verified',
+            lastname='User',
+            email='verified@example.com',
+            email_verified=True,
+        )
+
+        login_as(member.id)
 
         response = client.post('/auth/resend-verification')
         assert response.status_code == 400
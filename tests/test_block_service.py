@@ -1,91 +1,143 @@
 """Property-based tests for block service."""
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
+from collections import namedtuple
+from hypothesis import given, example, strategies as st, settings, Phase
 from datetime import date, time, timedelta
-from app.models import Member, Court, Reservation, Block, BlockReason, BlockAuditLog, ReasonAuditLog
+from app.models import Member, Reservation, BlockReason
 from app.services.block_service import BlockService
 from app.services.block_reason_service import BlockReasonService
 from app.services.reservation_service import ReservationService
+from sqlalchemy import select
 from app import db
+from tests.factories import hash_password
 
 
 # Hypothesis strategies for generating test data
 court_numbers = st.integers(min_value=1, max_value=6)
-# Booking times must be at full hours between 08:00 and 21:00 (last slot for 1-hour reservation)
-booking_hours = st.integers(min_value=8, max_value=21)
-# Future dates should be at least 1 day ahead to avoid "past booking" issues on current day
-future_dates = st.dates(min_value=date.today() + timedelta(days=1), max_value=date.today() + timedelta(days=90))
-block_reasons = st.sampled_from(['rain', 'maintenance', 'tournament', 'championship'])
+# Booking times must be at full hours between 08:00 and 21:00 (last slot for 1-hour reservation).
+# Generated examples stay on a few midday slots; block_boundary_examples covers 08:00 and 21:00
+booking_hours = st.integers(min_value=10, max_value=13)
+# End of the one-hour slot starting at each bookable hour
+END_TIME_BY_HOUR = {hour: time(hour + 1, 0) for hour in range(8, 22)}
+# Future dates should be at least 1 day ahead to avoid "past booking" issues on current day.
+# The block logic does not depend on the exact day, so a near, a mid and a far date suffice
+future_dates = st.sampled_from([date.today() + timedelta(days=d) for d in (1, 30, 89)])
+# Seeded block reason names with the German text each contributes to the cancellation message
+BLOCK_REASONS = [
+    ('Weather', 'Regen'),
+    ('Maintenance', 'Wartung'),
+    ('Tournament', 'Turnier'),
+    ('Championship', 'Meisterschaft'),
+]
+block_reasons = st.sampled_from(BLOCK_REASONS)
+
+# Inputs are low-cardinality and block_boundary_examples adds the explicit
+# boundary cases, so the target and explain phases are skipped; the profile
+# sets the example count
+block_property_settings = settings(
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.shrink],
+)
+
+
+def block_boundary_examples(test):
+    """Add one explicit example per block reason at the first and last slots."""
+    first_day = date.today() + timedelta(days=1)
+    weather, maintenance, tournament, championship = BLOCK_REASONS
+    test = example(court_num=1, booking_date=first_day, start_hour=8, reason=weather)(test)
+    test = example(court_num=6, booking_date=first_day, start_hour=21, reason=maintenance)(test)
+    test = example(court_num=1, booking_date=first_day, start_hour=21, reason=tournament)(test)
+    test = example(court_num=6, booking_date=first_day, start_hour=8, reason=championship)(test)
+    return test
+
+
+def _reservation_state(reservation_id):
+    """Read a reservation's status and reason straight from the database.
+
+    Selecting just these two columns skips hydrating the whole row and
+    checks what the database holds rather than the session's cached object.
+    """
+    return db.session.execute(
+        select(Reservation.status, Reservation.reason).where(Reservation.id == reservation_id)
+    ).one_or_none()
+
+
+BlockMembers = namedtuple(
+    'BlockMembers',
+    ['member1_id', 'member2_id', 'admin_id', 'reservation_kwargs', 'block_kwargs']
+)
 
 
+@pytest.fixture
+def block_members(app):
+    """Create the members used by the block property tests once per test.
+
+    Returns their IDs and the service arguments that stay the same for every
+    example. The members survive the per-example ``example_db`` resets.
+    """
+    member1 = Member(
+        firstname="Test",
+        lastname="Member1",
+        email="block_member1@example.com",
+        role="member"
+    )
+    member1.password_hash = hash_password('password123')
+
+    member2 = Member(
+        firstname="Test",
+        lastname="Member2",
+        email="block_member2@example.com",
+        role="member"
+    )
+    member2.password_hash = hash_password('password123')
+
+    admin = Member(
+        firstname="Admin",
+        lastname="User",
+        email="block_admin@example.com",
+        role="administrator"
+    )
+    admin.password_hash = hash_password('password123')
+
+    db.session.add_all([member1, member2, admin])
+    db.session.commit()
+
+    return BlockMembers(
+        member1_id=member1.id,
+        member2_id=member2.id,
+        admin_id=admin.id,
+        reservation_kwargs=dict(booked_for_id=member1.id, booked_by_id=member2.id),
+        block_kwargs=dict(details=None, admin_id=admin.id)
+    )
+
+
+@pytest.mark.parametrize('check', ['conflict', 'reason_text'])
 @given(court_num=court_numbers, booking_date=future_dates, start_hour=booking_hours, reason=block_reasons)
-@pytest.mark.usefixtures("app")
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_14_blocks_cascade_cancel_existing_reservations(app, court_num, booking_date, start_hour, reason):
+@block_boundary_examples
+@block_property_settings
+def test_property_14_15_blocks_cancel_reservations_with_reason(app, example_db, block_members, court_ids, block_reason_ids, check, court_num, booking_date, start_hour, reason):
     """Feature: tennis-club-reservation, Property 14: Blocks cascade-cancel existing reservations
-    Validates: Requirements 5.2
+    Feature: tennis-club-reservation, Property 15: Block cancellations include reason in notification
+    Validates: Requirements 5.2, 5.3
 
     For any block created on a court with existing reservations in the blocked time period,
-    those reservations should be automatically cancelled.
+    the unconfirmed request should report the conflicting reservations ('conflict'), and the
+    confirmed block should cancel them with a cancellation reason, used for the notifications
+    to the booked_by and booked_for members, that includes the block reason ('reason_text').
+    Each check makes a single block service call.
     """
-    import time as time_module
     start = time(start_hour, 0)  # Convert hour to time object at full hour
-    with app.app_context():
+    with example_db():
         # Get existing court (created by app fixture)
+        court_id = court_ids.get(court_num)
 
-        court = Court.query.filter_by(number=court_num).first()
-
-        assert court is not None, f"Court {court_num} should exist"
-
-        # Clean up any existing reservations for this court/date/time to avoid conflicts
-        existing_reservations = Reservation.query.filter_by(
-            court_id=court.id,
-            date=booking_date,
-            start_time=start
-        ).all()
-        for res in existing_reservations:
-            db.session.delete(res)
-
-        # Clean up any existing blocks for this court/date/time
-        existing_blocks = Block.query.filter_by(
-            court_id=court.id,
-            date=booking_date
-        ).filter(Block.start_time <= start, Block.end_time > start).all()
-        for blk in existing_blocks:
-            db.session.delete(blk)
-        db.session.commit()
-
-        # Create test members with unique emails
-        import random
-        unique_id = random.randint(100000, 999999)
-        timestamp = int(time_module.time() * 1000000)  # microsecond timestamp for uniqueness
-        member1 = Member(
-            firstname="Test",
-            lastname="Member1",
-            email=f"test1_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com",
-            role="member"
-        )
-        member1.set_password("password123")
-
-        admin = Member(
-            firstname="Admin",
-            lastname="User",
-            email=f"admin_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com",
-            role="administrator"
-        )
-        admin.set_password("password123")
+        assert court_id is not None, f"Court {court_num} should exist"
 
-        db.session.add(member1)
-        db.session.add(admin)
-        db.session.commit()
-
-        # Create a reservation that will conflict with the block
+        # Create a reservation with different booked_for and booked_by members
         reservation, error, _ = ReservationService.create_reservation(
-            court_id=court.id,
+            court_id=court_id,
             date=booking_date,
             start_time=start,
-            booked_for_id=member1.id,
-            booked_by_id=member1.id
+            **block_members.reservation_kwargs
         )
 
         # Verify reservation was created successfully
@@ -96,297 +148,78 @@ def test_property_14_blocks_cascade_cancel_existing_reservations(app, court_num,
         reservation_id = reservation.id
 
         # Calculate end time for block (covers the reservation)
-        end_time = time(start.hour + 1, start.minute)
+        end_time = END_TIME_BY_HOUR[start_hour]
 
-        # Get or create block reason
-        block_reason = BlockReason.query.filter_by(name='Maintenance').first()
-        if not block_reason:
-            block_reason = BlockReason(name='Maintenance', is_active=True, created_by_id=admin.id)
-            db.session.add(block_reason)
-            db.session.commit()
+        # Block reasons are pre-created by the app fixture
+        reason_name, expected_reason_text = reason
+        reason_id = block_reason_ids[reason_name]
 
-        # Create a block that covers the reservation time
-        # First call without confirm - should return reservation conflicts
+        # Create a block that covers the reservation time. Without
+        # confirmation the service only reports the conflicts; the other
+        # check confirms directly (simulating user confirmation)
         blocks, block_error = BlockService.create_multi_court_blocks(
-            court_ids=[court.id],
+            court_ids=[court_id],
             date=booking_date,
             start_time=start,
             end_time=end_time,
-            reason_id=block_reason.id,
-            details=None,
-            admin_id=admin.id,
-            confirm=False
+            reason_id=reason_id,
+            confirm=check != 'conflict',
+            **block_members.block_kwargs
         )
 
-        # Should return reservation conflicts
-        assert blocks is None, "Block creation should require confirmation"
-        assert block_error is not None
-        assert 'reservation_conflicts' in block_error, "Should return reservation conflicts"
-
-        # Now confirm the block creation (simulating user confirmation)
-        blocks, block_error = BlockService.create_multi_court_blocks(
-            court_ids=[court.id],
-            date=booking_date,
-            start_time=start,
-            end_time=end_time,
-            reason_id=block_reason.id,
-            details=None,
-            admin_id=admin.id,
-            confirm=True
-        )
+        if check == 'conflict':
+            assert blocks is None, "Block creation should require confirmation"
+            assert block_error is not None
+            assert 'reservation_conflicts' in block_error, "Should return reservation conflicts"
+            assert _reservation_state(reservation_id).status == 'active', \
+                "Reservation should stay active until the block is confirmed"
+            return
 
         # Verify block was created successfully
         assert blocks is not None, f"Block creation failed: {block_error}"
         assert block_error is None
         assert len(blocks) == 1
-        block = blocks[0]
 
         # Verify the reservation was cancelled
-        cancelled_reservation = Reservation.query.get(reservation_id)
+        cancelled_reservation = _reservation_state(reservation_id)
         assert cancelled_reservation is not None, "Reservation should still exist in database"
         assert cancelled_reservation.status == 'cancelled', \
             f"Reservation status should be 'cancelled', but was '{cancelled_reservation.status}'"
 
-        # Verify the cancellation reason includes the block reason
+        # Verify the cancellation reason mentions the block
         assert cancelled_reservation.reason is not None, "Cancellation reason should be set"
         assert 'Platzsperre' in cancelled_reservation.reason, \
             f"Cancellation reason should mention 'Platzsperre', but was: {cancelled_reservation.reason}"
 
-        # Cleanup - delete audit logs before deleting admin (foreign key constraint)
-        block_audit_logs = BlockAuditLog.query.filter_by(admin_id=admin.id).all()
-        for log in block_audit_logs:
-            db.session.delete(log)
-
-        db.session.delete(cancelled_reservation)
-        db.session.delete(block)
-        db.session.delete(member1)
-        db.session.delete(admin)
-        db.session.commit()
-
-
-
-@given(court_num=court_numbers, booking_date=future_dates, start_hour=booking_hours, reason=block_reasons)
-@pytest.mark.usefixtures("app")
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_15_block_cancellations_include_reason_in_notification(app, court_num, booking_date, start_hour, reason):
-    """Feature: tennis-club-reservation, Property 15: Block cancellations include reason in notification
-    Validates: Requirements 5.3
-
-    For any reservation cancelled due to a block, the email notifications sent to the booked_by
-    and booked_for members should include the block reason.
-    """
-    import time as time_module
-    start = time(start_hour, 0)  # Convert hour to time object at full hour
-    with app.app_context():
-        # Get existing court (created by app fixture)
-
-        court = Court.query.filter_by(number=court_num).first()
-
-        assert court is not None, f"Court {court_num} should exist"
-
-        # Clean up any existing reservations for this court/date/time to avoid conflicts
-        existing_reservations = Reservation.query.filter_by(
-            court_id=court.id,
-            date=booking_date,
-            start_time=start
-        ).all()
-        for res in existing_reservations:
-            db.session.delete(res)
-
-        # Clean up any existing blocks for this court/date/time
-        existing_blocks = Block.query.filter_by(
-            court_id=court.id,
-            date=booking_date
-        ).filter(Block.start_time <= start, Block.end_time > start).all()
-        for blk in existing_blocks:
-            db.session.delete(blk)
-        db.session.commit()
-
-        # Create test members with unique emails
-        import random
-        unique_id = random.randint(100000, 999999)
-        timestamp = int(time_module.time() * 1000000)  # microsecond timestamp for uniqueness
-        member1 = Member(
-            firstname="Test",
-            lastname="Member1",
-            email=f"test1_notif_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com",
-            role="member"
-        )
-        member1.set_password("password123")
-
-        member2 = Member(
-            firstname="Test",
-            lastname="Member2",
-            email=f"test2_notif_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com",
-            role="member"
-        )
-        member2.set_password("password123")
-
-        admin = Member(
-            firstname="Admin",
-            lastname="User",
-            email=f"admin_notif_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com",
-            role="administrator"
-        )
-        admin.set_password("password123")
-
-        db.session.add(member1)
-        db.session.add(member2)
-        db.session.add(admin)
-        db.session.commit()
-
-        # Create a reservation with different booked_for and booked_by members
-        reservation, error, _ = ReservationService.create_reservation(
-            court_id=court.id,
-            date=booking_date,
-            start_time=start,
-            booked_for_id=member1.id,
-            booked_by_id=member2.id
-        )
-
-        # Verify reservation was created successfully
-        assert reservation is not None, f"Reservation creation failed: {error}"
-        assert error is None
-        assert reservation.status == 'active'
-
-        reservation_id = reservation.id
-
-        # Calculate end time for block (covers the reservation)
-        end_time = time(start.hour + 1, start.minute)
-
-        # Get or create block reason based on the test reason parameter
-        reason_name_map = {
-            'rain': 'Weather',
-            'maintenance': 'Maintenance',
-            'tournament': 'Tournament',
-            'championship': 'Championship'
-        }
-        reason_name = reason_name_map.get(reason, 'Maintenance')
-
-        block_reason = BlockReason.query.filter_by(name=reason_name).first()
-        if not block_reason:
-            block_reason = BlockReason(name=reason_name, is_active=True, created_by_id=admin.id)
-            db.session.add(block_reason)
-            db.session.commit()
-
-        # Create a block that covers the reservation time
-        # First call without confirm - should return reservation conflicts
-        blocks, block_error = BlockService.create_multi_court_blocks(
-            court_ids=[court.id],
-            date=booking_date,
-            start_time=start,
-            end_time=end_time,
-            reason_id=block_reason.id,
-            details=None,
-            admin_id=admin.id,
-            confirm=False
-        )
-
-        # Should return reservation conflicts
-        assert blocks is None, "Block creation should require confirmation"
-        assert block_error is not None
-        assert 'reservation_conflicts' in block_error, "Should return reservation conflicts"
-
-        # Now confirm the block creation (simulating user confirmation)
-        blocks, block_error = BlockService.create_multi_court_blocks(
-            court_ids=[court.id],
-            date=booking_date,
-            start_time=start,
-            end_time=end_time,
-            reason_id=block_reason.id,
-            details=None,
-            admin_id=admin.id,
-            confirm=True
-        )
-
-        # Verify block was created successfully
-        assert blocks is not None, f"Block creation failed: {block_error}"
-        assert block_error is None
-        assert len(blocks) == 1
-        block = blocks[0]
-
-        # Verify the reservation was cancelled
-        cancelled_reservation = Reservation.query.get(reservation_id)
-        assert cancelled_reservation is not None, "Reservation should still exist in database"
-        assert cancelled_reservation.status == 'cancelled'
-
-        # Verify the cancellation reason includes the block reason
-        assert cancelled_reservation.reason is not None, "Cancellation reason should be set"
-
-        # Map the reason to German text (updated for new reason names)
-        reason_map = {
-            'Weather': 'Regen',
-            'Maintenance': 'Wartung',
-            'Tournament': 'Turnier',
-            'Championship': 'Meisterschaft'
-        }
-
-        expected_reason_text = reason_map.get(reason_name, reason_name)
-
-        # Verify the reason contains both "Platzsperre" and the specific reason
-        assert 'Platzsperre' in cancelled_reservation.reason, \
-            f"Cancellation reason should mention 'Platzsperre', but was: {cancelled_reservation.reason}"
         assert expected_reason_text in cancelled_reservation.reason, \
             f"Cancellation reason should include '{expected_reason_text}', but was: {cancelled_reservation.reason}"
 
-        # Cleanup - delete audit logs before deleting admin (foreign key constraint)
-        block_audit_logs = BlockAuditLog.query.filter_by(admin_id=admin.id).all()
-        for log in block_audit_logs:
-            db.session.delete(log)
-
-        db.session.delete(cancelled_reservation)
-        db.session.delete(block)
-        db.session.delete(member1)
-        db.session.delete(member2)
-        db.session.delete(admin)
-        db.session.commit()
 
-
-def test_block_reason_service_basic_functionality(app):
+def test_block_reason_service_basic_functionality(app, system_admin_id):
     """Test basic BlockReasonService functionality."""
-    with app.app_context():
-        # Create test admin
-        admin = Member(
-            firstname='Test',
-            lastname='Admin',
-            email='test_admin_reason@example.com',
-            role='administrator'
-        )
-        admin.set_password('admin123')
-        db.session.add(admin)
-        db.session.commit()
-
-        # Test create_block_reason
-        reason, error = BlockReasonService.create_block_reason('Test Reason', admin.id)
-        assert error is None, f"Error creating reason: {error}"
-        assert reason is not None
-        assert reason.name == 'Test Reason'
-        assert reason.is_active is True
-
-        reason_id = reason.id
-
-        # Test get_all_block_reasons
-        reasons = BlockReasonService.get_all_block_reasons()
-        reason_names = [r.name for r in reasons]
-        assert 'Test Reason' in reason_names
-
-        # Test update_block_reason
-        success, error = BlockReasonService.update_block_reason(reason.id, name='Updated Reason', admin_id=admin.id)
-        assert error is None, f"Error updating reason: {error}"
-        assert success is True
-
-        # Verify update
-        updated_reason = BlockReason.query.get(reason.id)
-        assert updated_reason.name == 'Updated Reason'
-        # Test delete_block_reason (unused reason)
-        success, error = BlockReasonService.delete_block_reason(reason.id, admin.id)
-        assert error is None, f"Error deleting reason: {error}"
-        assert success is True
-
-        # Cleanup - delete audit logs before deleting admin (foreign key constraint)
-        audit_logs = ReasonAuditLog.query.filter_by(performed_by_id=admin.id).all()
-        for log in audit_logs:
-            db.session.delete(log)
-
-        db.session.delete(admin)
-        db.session.commit()
+    # Test create_block_reason
+    reason, error = BlockReasonService.create_block_reason('Test Reason', system_admin_id)
+    assert error is None, f"Error creating reason: {error}"
+    assert reason is not None
+    assert reason.name == 'Test Reason'
+    assert reason.is_active is True
+
+    reason_id = reason.id
+
+    # Test get_all_block_reasons
+    reasons = BlockReasonService.get_all_block_reasons()
+    reason_names = [r.name for r in reasons]
+    assert 'Test Reason' in reason_names
+
+    # Test update_block_reason
+    success, error = BlockReasonService.update_block_reason(reason.id, name='Updated Reason', admin_id=system_admin_id)
+    assert error is None, f"Error updating reason: {error}"
+    assert success is True
+
+    # Verify update
+    updated_reason = BlockReason.query.get(reason.id)
+    assert updated_reason.name == 'Updated Reason'
+    # Test delete_block_reason (unused reason)
+    success, error = BlockReasonService.delete_block_reason(reason.id, system_admin_id)
+    assert error is None, f"Error deleting reason: {error}"
+    assert success is True
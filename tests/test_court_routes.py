@@ -2,7 +2,12 @@
 import pytest
 from datetime import date, time
 from app import db
-from app.models import Court, Reservation, Block, BlockReason
+from app.models import Court, Reservation, Block
+
+
+def _occupied_by_court(courts):
+    """Index a sparse availability ``courts`` list as {court_id: {time: slot}}."""
+    return {c['court_id']: {s['time']: s for s in c['occupied']} for c in courts}
 
 
 class TestListCourts:
@@ -13,19 +18,30 @@ class TestListCourts:
         response = client.get('/courts/')
         assert response.status_code == 302  # Redirect to login
     
-    def test_list_courts_returns_all_courts(self, client, test_member):
+    def test_list_courts_returns_all_courts(self, client, login_as, test_member):
         """Test listing courts returns all courts."""
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
             response = client.get('/courts/')
             assert response.status_code == 200
             data = response.get_json()
             assert 'courts' in data
             assert len(data['courts']) == 6  # Default 6 courts
 
+    def test_list_courts_reflects_status_change(self, client, login_as, test_member, app):
+        """Test the court list shows a status change made after an earlier request."""
+        login_as(test_member.id)
+        response = client.get('/courts/')
+        assert response.get_json()['courts'][0]['status'] == 'available'
+
+        with app.app_context():
+            court = Court.query.filter_by(number=1).first()
+            court.status = 'maintenance'
+            db.session.commit()
+
+        response = client.get('/courts/')
+        assert response.get_json()['courts'][0]['status'] == 'maintenance'
+
 
 class TestGetAvailability:
     """Test get availability endpoint (sparse format)."""
@@ -57,13 +73,10 @@ class TestGetAvailability:
         from datetime import date
         assert data['date'] == date.today().isoformat()
 
-    def test_availability_returns_sparse_format_for_authenticated_user(self, client, test_member, app):
+    def test_availability_returns_sparse_format_for_authenticated_user(self, client, login_as, test_member, app):
         """Test availability returns sparse format for authenticated users."""
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
             response = client.get('/api/courts/availability?date=2026-12-05')
             assert response.status_code == 200
             data = response.get_json()
@@ -74,15 +87,13 @@ class TestGetAvailability:
             # Sparse format has 'occupied' arrays, not 'slots'
             assert 'occupied' in data['courts'][0]
     
-    def test_availability_shows_reservations_to_authenticated_users(self, client, test_member, app):
+    def test_availability_shows_reservations_to_authenticated_users(self, client, login_as, test_member, app, court_ids):
         """Test availability shows reservation details to authenticated users."""
-        court_id = None
         with app.app_context():
             # Create a reservation
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 5),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -94,32 +105,27 @@ class TestGetAvailability:
             db.session.commit()
 
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
             response = client.get('/api/courts/availability?date=2026-12-05')
             assert response.status_code == 200
             data = response.get_json()
 
             # Find the court and slot in sparse format
-            court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-            assert court_data is not None
-            slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+            occupied = _occupied_by_court(data['courts'])
+            assert court_id in occupied
+            slot_10 = occupied[court_id].get('10:00')
             assert slot_10 is not None
             assert slot_10['status'] == 'reserved'
             assert slot_10['details'] is not None
             assert 'booked_for' in slot_10['details']
     
-    def test_availability_hides_reservation_details_from_anonymous_users(self, client, test_member, app):
+    def test_availability_hides_reservation_details_from_anonymous_users(self, client, test_member, app, court_ids):
         """Test availability hides reservation details from anonymous users."""
-        court_id = None
         with app.app_context():
             # Create a reservation
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 5),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -136,33 +142,24 @@ class TestGetAvailability:
         data = response.get_json()
 
         # Find the court and slot in sparse format
-        court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-        assert court_data is not None
-        slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+        occupied = _occupied_by_court(data['courts'])
+        assert court_id in occupied
+        slot_10 = occupied[court_id].get('10:00')
         assert slot_10 is not None
         assert slot_10['status'] == 'reserved'
         assert slot_10['details'] is None  # Details should be filtered out
     
-    def test_availability_shows_blocks_to_all_users(self, client, test_admin, app):
+    def test_availability_shows_blocks_to_all_users(self, client, login_as, test_admin, app, court_ids, block_reason_ids):
         """Test availability shows blocked slots to both authenticated and anonymous users."""
-        court_id = None
         with app.app_context():
-            # Get or create block reason
-            block_reason = BlockReason.query.filter_by(name='Maintenance').first()
-            if not block_reason:
-                block_reason = BlockReason(name='Maintenance', is_active=True, created_by_id=test_admin.id)
-                db.session.add(block_reason)
-                db.session.commit()
-
             # Create a block
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             block = Block(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 5),
                 start_time=time(14, 0),
                 end_time=time(16, 0),
-                reason_id=block_reason.id,
+                reason_id=block_reason_ids['Maintenance'],
                 created_by_id=test_admin.id,
                 details='Test maintenance block'
             )
@@ -175,9 +172,9 @@ class TestGetAvailability:
         data = response.get_json()
 
         # Find the court and slot in sparse format
-        court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-        assert court_data is not None
-        slot_14 = next((s for s in court_data['occupied'] if s['time'] == '14:00'), None)
+        occupied = _occupied_by_court(data['courts'])
+        assert court_id in occupied
+        slot_14 = occupied[court_id].get('14:00')
         assert slot_14 is not None
         assert slot_14['status'] == 'blocked'
         assert slot_14['details'] is not None
@@ -186,32 +183,27 @@ class TestGetAvailability:
 
         # Test authenticated access - should see same block information
         with client:
-            client.post('/auth/login', data={
-                'email': test_admin.email,
-                'password': 'admin123'
-            })
+            login_as(test_admin.id)
             response = client.get('/api/courts/availability?date=2026-12-05')
             assert response.status_code == 200
             data = response.get_json()
 
-            court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-            assert court_data is not None
-            slot_14 = next((s for s in court_data['occupied'] if s['time'] == '14:00'), None)
+            occupied = _occupied_by_court(data['courts'])
+            assert court_id in occupied
+            slot_14 = occupied[court_id].get('14:00')
             assert slot_14 is not None
             assert slot_14['status'] == 'blocked'
             assert slot_14['details'] is not None
             assert slot_14['details']['reason'] == 'Maintenance'
             assert slot_14['details']['details'] == 'Test maintenance block'
     
-    def test_availability_normalizes_short_notice_for_anonymous_users(self, client, test_member, app):
+    def test_availability_normalizes_short_notice_for_anonymous_users(self, client, login_as, test_member, app, court_ids):
         """Test availability normalizes short notice bookings to 'reserved' for anonymous users."""
-        court_id = None
         with app.app_context():
             # Create a short notice reservation
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 5),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -228,30 +220,90 @@ class TestGetAvailability:
         assert response.status_code == 200
         data = response.get_json()
 
-        court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-        assert court_data is not None
-        slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+        occupied = _occupied_by_court(data['courts'])
+        assert court_id in occupied
+        slot_10 = occupied[court_id].get('10:00')
         assert slot_10 is not None
         assert slot_10['status'] == 'reserved'  # Should be normalized from 'short_notice'
         assert slot_10['details'] is None
 
         # Authenticated request should see it as 'short_notice'
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
             response = client.get('/api/courts/availability?date=2026-12-05')
             assert response.status_code == 200
             data = response.get_json()
 
-            court_data = next((c for c in data['courts'] if c['court_id'] == court_id), None)
-            assert court_data is not None
-            slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+            occupied = _occupied_by_court(data['courts'])
+            assert court_id in occupied
+            slot_10 = occupied[court_id].get('10:00')
             assert slot_10 is not None
             assert slot_10['status'] == 'short_notice'  # Should preserve original status
             assert slot_10['details'] is not None
 
+    def test_availability_reflects_court_changes(self, client, app):
+        """Test a court removed after an earlier request disappears from availability."""
+        response = client.get('/api/courts/availability?date=2026-12-05')
+        assert len(response.get_json()['courts']) == 6
+
+        with app.app_context():
+            court = Court.query.filter_by(number=6).first()
+            db.session.delete(court)
+            db.session.commit()
+
+        response = client.get('/api/courts/availability?date=2026-12-05')
+        court_numbers = [c['court_number'] for c in response.get_json()['courts']]
+        assert court_numbers == [1, 2, 3, 4, 5]
+
+
+class TestAvailabilityGrid:
+    """Test the full-grid availability endpoint."""
+
+    def test_grid_places_blocks_and_reservations(self, client, login_as, test_member, test_admin, app, court_ids, block_reason_ids):
+        """Test blocks cover every slot in their range and reservations their start slot."""
+        court_id = court_ids[1]
+        with app.app_context():
+            db.session.add_all([
+                Block(
+                    court_id=court_id,
+                    date=date(2026, 12, 5),
+                    start_time=time(14, 0),
+                    end_time=time(16, 0),
+                    reason_id=block_reason_ids['Maintenance'],
+                    created_by_id=test_admin.id
+                ),
+                Reservation(
+                    court_id=court_id,
+                    date=date(2026, 12, 5),
+                    start_time=time(10, 0),
+                    end_time=time(11, 0),
+                    booked_for_id=test_member.id,
+                    booked_by_id=test_member.id,
+                    status='active'
+                )
+            ])
+            db.session.commit()
+
+        login_as(test_member.id)
+        response = client.get('/courts/availability?date=2026-12-05')
+        assert response.status_code == 200
+        grid = response.get_json()['grid']
+
+        slots = {
+            slot['time']: slot
+            for slot in next(c for c in grid if c['court_id'] == court_id)['slots']
+        }
+        assert slots['10:00']['status'] == 'reserved'
+        assert slots['10:00']['details']['booked_for_id'] == test_member.id
+        assert slots['14:00']['status'] == 'blocked'
+        assert slots['15:00']['status'] == 'blocked'
+        assert slots['15:00']['details']['reason'] == 'Maintenance'
+        assert slots['16:00']['status'] == 'available'
+        assert slots['11:00']['status'] == 'available'
+
+        other_court = next(c for c in grid if c['court_id'] != court_id)
+        assert all(slot['status'] == 'available' for slot in other_court['slots'])
+
 
 class TestRateLimiting:
     """Test rate limiting for anonymous users."""
@@ -269,13 +321,10 @@ class TestRateLimiting:
         for response in responses:
             assert response.status_code == 200
 
-    def test_rate_limiting_not_applied_to_authenticated_users(self, client, test_member, app):
+    def test_rate_limiting_not_applied_to_authenticated_users(self, client, login_as, test_member, app):
         """Test that rate limiting is not applied to authenticated users."""
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
 
             # Make multiple requests as authenticated user
             responses = []
@@ -304,8 +353,7 @@ class TestRateLimiting:
             assert status_code == 429
             
             # Parse JSON response
-            import json
-            data = json.loads(response.data)
+            data = response.get_json()
             assert 'error' in data
             assert 'retry_after' in data
             assert data['retry_after'] == 3600
@@ -387,14 +435,12 @@ class TestGetAvailabilityRange:
         assert 'cache_hint_seconds' in data['metadata']
         assert data['metadata']['cache_hint_seconds'] == 30
 
-    def test_range_shows_reservations_to_authenticated_users(self, client, test_member, app):
+    def test_range_shows_reservations_to_authenticated_users(self, client, login_as, test_member, app, court_ids):
         """Test range endpoint shows reservation details to authenticated users."""
-        court_id = None
         with app.app_context():
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 6),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -406,10 +452,7 @@ class TestGetAvailabilityRange:
             db.session.commit()
 
         with client:
-            client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
+            login_as(test_member.id)
             response = client.get('/api/courts/availability/range?start=2026-12-05&days=3')
             assert response.status_code == 200
             data = response.get_json()
@@ -418,22 +461,20 @@ class TestGetAvailabilityRange:
             day_data = data['days'].get('2026-12-06')
             assert day_data is not None
 
-            court_data = next((c for c in day_data['courts'] if c['court_id'] == court_id), None)
-            assert court_data is not None
-            slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+            occupied = _occupied_by_court(day_data['courts'])
+            assert court_id in occupied
+            slot_10 = occupied[court_id].get('10:00')
             assert slot_10 is not None
             assert slot_10['status'] == 'reserved'
             assert slot_10['details'] is not None
             assert 'booked_for' in slot_10['details']
 
-    def test_range_hides_details_from_anonymous_users(self, client, test_member, app):
+    def test_range_hides_details_from_anonymous_users(self, client, test_member, app, court_ids):
         """Test range endpoint hides reservation details from anonymous users."""
-        court_id = None
         with app.app_context():
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 6),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -452,26 +493,23 @@ class TestGetAvailabilityRange:
         day_data = data['days'].get('2026-12-06')
         assert day_data is not None
 
-        court_data = next((c for c in day_data['courts'] if c['court_id'] == court_id), None)
-        assert court_data is not None
-        slot_10 = next((s for s in court_data['occupied'] if s['time'] == '10:00'), None)
+        occupied = _occupied_by_court(day_data['courts'])
+        assert court_id in occupied
+        slot_10 = occupied[court_id].get('10:00')
         assert slot_10 is not None
         assert slot_10['status'] == 'reserved'
         assert slot_10['details'] is None
 
-    def test_range_shows_blocks(self, client, test_admin, app):
+    def test_range_shows_blocks(self, client, test_admin, app, court_ids, block_reason_ids):
         """Test range endpoint shows blocks correctly."""
-        court_id = None
         with app.app_context():
-            block_reason = BlockReason.query.filter_by(name='Maintenance').first()
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             block = Block(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 7),
                 start_time=time(14, 0),
                 end_time=time(16, 0),
-                reason_id=block_reason.id,
+                reason_id=block_reason_ids['Maintenance'],
                 created_by_id=test_admin.id,
                 details='Range test block'
             )
@@ -485,9 +523,9 @@ class TestGetAvailabilityRange:
         day_data = data['days'].get('2026-12-07')
         assert day_data is not None
 
-        court_data = next((c for c in day_data['courts'] if c['court_id'] == court_id), None)
-        assert court_data is not None
-        slot_14 = next((s for s in court_data['occupied'] if s['time'] == '14:00'), None)
+        occupied = _occupied_by_court(day_data['courts'])
+        assert court_id in occupied
+        slot_14 = occupied[court_id].get('14:00')
         assert slot_14 is not None
         assert slot_14['status'] == 'blocked'
         assert slot_14['details']['reason'] == 'Maintenance'
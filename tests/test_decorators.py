@@ -3,7 +3,12 @@ import pytest
 from flask import Flask, jsonify
 from flask_login import login_user, logout_user
 from app.decorators import login_required_json, admin_required, member_or_admin_required
-from app.models import Member
+
+
+@pytest.fixture
+def app(fresh_app):
+    """Use a fresh app per test: the shared app cannot take new routes."""
+    return fresh_app
 
 
 @pytest.fixture
@@ -34,6 +39,12 @@ def test_client(test_app):
     return test_app.test_client()
 
 
+@pytest.fixture
+def client(test_client):
+    """Let login_as log in the client the tests use."""
+    return test_client
+
+
 class TestLoginRequiredJson:
     """Test login_required_json decorator."""
 
@@ -44,16 +55,12 @@ class TestLoginRequiredJson:
         assert response.status_code == 401
         assert b'Authentifizierung erforderlich' in response.data
 
-    def test_authenticated_request_succeeds(self, test_client, test_app, test_member):
+    def test_authenticated_request_succeeds(self, test_client, test_app, test_member, login_as):
         """Test authenticated request succeeds."""
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
-            response = test_client.get('/test/json-protected')
-            assert response.status_code == 200
-            assert b'success' in response.data
+        login_as(test_member.id)
+        response = test_client.get('/test/json-protected')
+        assert response.status_code == 200
+        assert b'success' in response.data
 
 
 class TestAdminRequired:
@@ -65,28 +72,20 @@ class TestAdminRequired:
                             headers={'Accept': 'application/json'})
         assert response.status_code == 401
 
-    def test_non_admin_returns_403(self, test_client, test_app, test_member):
+    def test_non_admin_returns_403(self, test_client, test_app, test_member, login_as):
         """Test non-admin user returns 403."""
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
-            response = test_client.get('/test/admin-only',
-                                headers={'Accept': 'application/json'})
-            assert response.status_code == 403
-            assert b'keine Berechtigung' in response.data
-
-    def test_admin_succeeds(self, test_client, test_app, test_admin):
+        login_as(test_member.id)
+        response = test_client.get('/test/admin-only',
+                            headers={'Accept': 'application/json'})
+        assert response.status_code == 403
+        assert b'keine Berechtigung' in response.data
+
+    def test_admin_succeeds(self, test_client, test_app, test_admin, login_as):
         """Test admin user succeeds."""
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': test_admin.email,
-                'password': 'admin123'
-            })
-            response = test_client.get('/test/admin-only')
-            assert response.status_code == 200
-            assert b'admin access' in response.data
+        login_as(test_admin.id)
+        response = test_client.get('/test/admin-only')
+        assert response.status_code == 200
+        assert b'admin access' in response.data
 
 
 class TestMemberOrAdminRequired:
@@ -98,70 +97,19 @@ class TestMemberOrAdminRequired:
                             headers={'Accept': 'application/json'})
         assert response.status_code == 401
 
-    def test_own_member_id_succeeds(self, test_client, test_app):
-        """Test accessing own member ID succeeds."""
-        with test_app.app_context():
-            # Create a test member within app context
-            member = Member(
-                firstname='Test',
-                lastname='User',
-                email='testuser@example.com',
-                role='member'
-            )
-            member.set_password('password123')
-            from app import db
-            db.session.add(member)
-            db.session.commit()
-            member_id = member.id
-            member_email = member.email
-
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': member_email,
-                'password': 'password123'
-            })
-            response = test_client.get(f'/test/member/{member_id}')
-            assert response.status_code == 200
-
-    def test_different_member_id_returns_403(self, test_client, test_app, test_member):
-        """Test accessing different member ID returns 403."""
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': test_member.email,
-                'password': 'password123'
-            })
-            response = test_client.get('/test/member/999',
-                                headers={'Accept': 'application/json'})
-            assert response.status_code == 403
-
-    def test_admin_can_access_any_member(self, test_client, test_app):
+    def test_member_can_access_only_own_member_id(self, test_client, test_app, test_member, login_as):
+        """Test accessing own member ID succeeds and a different one returns 403."""
+        login_as(test_member.id)
+
+        response = test_client.get(f'/test/member/{test_member.id}')
+        assert response.status_code == 200
+
+        response = test_client.get('/test/member/999',
+                            headers={'Accept': 'application/json'})
+        assert response.status_code == 403
+
+    def test_admin_can_access_any_member(self, test_client, test_app, test_admin, test_member, login_as):
         """Test admin can access any member ID."""
-        with test_app.app_context():
-            # Create admin and member within app context
-            from app import db
-            admin = Member(
-                firstname='Admin',
-                lastname='User',
-                email='admintest@example.com',
-                role='administrator'
-            )
-            admin.set_password('admin123')
-            member = Member(
-                firstname='Regular',
-                lastname='User',
-                email='regularuser@example.com',
-                role='member'
-            )
-            member.set_password('password123')
-            db.session.add_all([admin, member])
-            db.session.commit()
-            admin_email = admin.email
-            member_id = member.id
-
-        with test_client:
-            test_client.post('/auth/login', data={
-                'email': admin_email,
-                'password': 'admin123'
-            })
-            response = test_client.get(f'/test/member/{member_id}')
-            assert response.status_code == 200
+        login_as(test_admin.id)
+        response = test_client.get(f'/test/member/{test_member.id}')
+        assert response.status_code == 200
@@ -1,6 +1,6 @@
 """Property-based tests for member management functionality."""
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
+from hypothesis import given, strategies as st
 from app import create_app, db
 from app.models import Member
 
@@ -23,7 +23,6 @@ valid_names = st.text(min_size=1, max_size=100, alphabet=st.characters(
     new_email=valid_emails,
     password=valid_passwords
 )
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_18_member_updates_modify_stored_data(original_firstname, original_lastname, original_email, new_firstname, new_lastname, new_email, password):
     """Feature: tennis-club-reservation, Property 18: Member updates modify stored data
     Validates: Requirements 6.2
@@ -80,7 +79,6 @@ def test_property_18_member_updates_modify_stored_data(original_firstname, origi
     email=valid_emails,
     password=valid_passwords
 )
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_19_member_deletion_removes_from_database(firstname, lastname, email, password):
     """Feature: tennis-club-reservation, Property 19: Member deletion removes from database
     Validates: Requirements 6.3
@@ -135,7 +133,6 @@ def test_property_19_member_deletion_removes_from_database(firstname, lastname,
     member2_email=valid_emails,
     password=valid_passwords
 )
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_7_favourites_add_and_remove_operations(
     member1_firstname, member1_lastname, member1_email, member2_firstname, member2_lastname, member2_email, password
 ):
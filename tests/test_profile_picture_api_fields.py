@@ -2,18 +2,16 @@
 import pytest
 from datetime import date, time
 from app import db
-from app.models import Court, Reservation, Member
+from app.models import Reservation, Member
 
 
 class TestAvailabilityProfilePictureFields:
     """Test profile picture fields in court availability API."""
 
-    def test_availability_includes_profile_picture_fields_for_authenticated(self, client, test_member, app):
+    def test_availability_includes_profile_picture_fields_for_authenticated(self, client, test_member, app, court_ids):
         """Test availability includes profile picture fields for authenticated users."""
-        court_id = None
         with app.app_context():
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             # Set up profile picture on test member
             member = Member.query.get(test_member.id)
             member.has_profile_picture = True
@@ -21,7 +19,7 @@ class TestAvailabilityProfilePictureFields:
             db.session.commit()
 
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 5),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -55,12 +53,10 @@ class TestAvailabilityProfilePictureFields:
             assert 'booked_by_profile_picture_version' in slot['details']
             assert slot['details']['booked_by_profile_picture_version'] == 3
 
-    def test_availability_profile_fields_with_no_profile_picture(self, client, test_member, app):
+    def test_availability_profile_fields_with_no_profile_picture(self, client, test_member, app, court_ids):
         """Test availability returns false for members without profile pictures."""
-        court_id = None
         with app.app_context():
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             # Ensure member has no profile picture
             member = Member.query.get(test_member.id)
             member.has_profile_picture = False
@@ -68,7 +64,7 @@ class TestAvailabilityProfilePictureFields:
             db.session.commit()
 
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 6),
                 start_time=time(14, 0),
                 end_time=time(15, 0),
@@ -94,14 +90,12 @@ class TestAvailabilityProfilePictureFields:
             assert slot['details']['booked_for_has_profile_picture'] is False
             assert slot['details']['booked_for_profile_picture_version'] == 0
 
-    def test_availability_hides_profile_fields_from_anonymous(self, client, test_member, app):
+    def test_availability_hides_profile_fields_from_anonymous(self, client, test_member, app, court_ids):
         """Test availability hides profile picture fields from anonymous users."""
-        court_id = None
         with app.app_context():
-            court = Court.query.first()
-            court_id = court.id
+            court_id = court_ids[1]
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 7),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -127,17 +121,17 @@ class TestAvailabilityProfilePictureFields:
 class TestReservationProfilePictureFields:
     """Test profile picture fields in reservation API."""
 
-    def test_reservation_list_includes_booked_by_profile_fields(self, client, test_member, app):
+    def test_reservation_list_includes_booked_by_profile_fields(self, client, test_member, app, court_ids):
         """Test reservation list includes booked_by profile picture fields."""
         with app.app_context():
-            court = Court.query.first()
+            court_id = court_ids[1]
             member = Member.query.get(test_member.id)
             member.has_profile_picture = True
             member.profile_picture_version = 2
             db.session.commit()
 
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 8),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
@@ -174,10 +168,10 @@ class TestReservationProfilePictureFields:
             assert 'booked_by_profile_picture_version' in res
             assert res['booked_by_profile_picture_version'] == 2
 
-    def test_reservation_different_booker_profile_fields(self, client, test_member, test_admin, app):
+    def test_reservation_different_booker_profile_fields(self, client, test_member, test_admin, app, court_ids):
         """Test reservation shows different profile fields when booked_for != booked_by."""
         with app.app_context():
-            court = Court.query.first()
+            court_id = court_ids[1]
 
             # Set up different profile states
             member = Member.query.get(test_member.id)
@@ -191,7 +185,7 @@ class TestReservationProfilePictureFields:
 
             # Admin books for member
             reservation = Reservation(
-                court_id=court.id,
+                court_id=court_id,
                 date=date(2026, 12, 9),
                 start_time=time(11, 0),
                 end_time=time(12, 0),
@@ -1,10 +1,11 @@
 """Property-based tests for reservation service."""
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
+from hypothesis import given, strategies as st
 from datetime import date, time, timedelta
 from app.models import Member, Court, Reservation
 from app.services.reservation_service import ReservationService
 from app import db
+from tests.factories import hash_password
 
 
 # Hypothesis strategies for generating test data
@@ -16,40 +17,35 @@ future_dates = st.dates(min_value=date.today(), max_value=date.today() + timedel
 
 @given(court_num=court_numbers, booking_date=future_dates, start=booking_times)
 @pytest.mark.usefixtures("app")
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_33_one_hour_duration_enforcement(app, court_num, booking_date, start):
+def test_property_33_one_hour_duration_enforcement(app, example_db, court_num, booking_date, start):
     """Feature: tennis-club-reservation, Property 33: One-hour duration enforcement
     Validates: Requirements 14.2
     
     For any reservation created, the duration (end_time - start_time) should equal exactly one hour.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court (created by app fixture)
         court = Court.query.filter_by(number=court_num).first()
         assert court is not None, f"Court {court_num} should exist"
         
-        # Create test members with unique emails
-        import random
-        import time as time_module
-        unique_id = random.randint(100000, 999999)
-        timestamp = int(time_module.time() * 1000000)  # microsecond precision
+        # Create test members
         member1 = Member(
             firstname="Test", 
             lastname="Member1",
-            email=f"test1_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com", 
+            email="test1@example.com", 
             role="member"
         )
-        member1.set_password("password123")
+        member1.password_hash = hash_password('password123')
         member2 = Member(
             firstname="Test", 
             lastname="Member2",
-            email=f"test2_{unique_id}_{timestamp}_{court_num}_{booking_date}_{start.hour}_{start.minute}@example.com", 
+            email="test2@example.com", 
             role="member"
         )
-        member2.set_password("password123")
+        member2.password_hash = hash_password('password123')
         db.session.add(member1)
         db.session.add(member2)
-        db.session.commit()
+        db.session.flush()
         
         # Create reservation using the service with a fixed current_time to ensure validity
         # Use a time early in the day to ensure all generated booking times are in the future
@@ -84,12 +80,6 @@ def test_property_33_one_hour_duration_enforcement(app, court_num, booking_date,
         expected_end = time(start.hour + 1, start.minute)
         assert reservation.end_time == expected_end, \
             f"End time should be {expected_end}, but was {reservation.end_time}"
-        
-        # Cleanup (don't delete court - it's shared)
-        db.session.delete(reservation)
-        db.session.delete(member1)
-        db.session.delete(member2)
-        db.session.commit()
 
 
 def test_book_cancel_rebook_same_slot(app):
@@ -110,18 +100,16 @@ def test_book_cancel_rebook_same_slot(app):
             db.session.add(court)
             db.session.commit()
         
-        # Create unique member for this test
-        import random
-        unique_id = random.randint(10000, 99999)
+        # Create member for this test
         member = Member(
             firstname="Test",
-            lastname=f"Member{unique_id}",
-            email=f"test_rebook_{unique_id}@example.com",
+            lastname="Member",
+            email="test_rebook@example.com",
             role="member"
         )
-        member.set_password("password123")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Test data
         test_date = date.today() + timedelta(days=1)
@@ -1,9 +1,12 @@
 """Property-based tests for validation service."""
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
-from datetime import time
+from hypothesis import given, strategies as st, settings
+from datetime import date, datetime, time, timedelta
+from app.models import Member, Court, Reservation, Block
 from app.services.validation_service import ValidationService
-from app.models import BlockReason
+from app.services.reservation_service import ReservationService
+from app import db
+from tests.factories import hash_password
 
 
 # Hypothesis strategies
@@ -14,7 +17,6 @@ invalid_late_times = st.times(min_value=time(22, 0), max_value=time(23, 59))
 
 
 @given(start_time=valid_booking_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_32_time_slot_validation_accepts_valid_times(app, start_time):
     """Feature: tennis-club-reservation, Property 32: Time slot validation
     Validates: Requirements 14.1, 14.3
@@ -28,7 +30,6 @@ def test_property_32_time_slot_validation_accepts_valid_times(app, start_time):
 
 
 @given(start_time=invalid_early_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_32_time_slot_validation_rejects_early_times(app, start_time):
     """Feature: tennis-club-reservation, Property 32: Time slot validation
     Validates: Requirements 14.1, 14.3
@@ -41,7 +42,6 @@ def test_property_32_time_slot_validation_rejects_early_times(app, start_time):
 
 
 @given(start_time=invalid_late_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_32_time_slot_validation_rejects_late_times(app, start_time):
     """Feature: tennis-club-reservation, Property 32: Time slot validation
     Validates: Requirements 14.1, 14.3
@@ -57,7 +57,6 @@ def test_property_32_time_slot_validation_rejects_late_times(app, start_time):
                            hour=st.integers(min_value=6, max_value=21), 
                            minute=st.integers(min_value=1, max_value=59), 
                            second=st.integers(min_value=0, max_value=59)))
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_32_time_slot_validation_rejects_non_full_hour_times(app, start_time):
     """Feature: tennis-club-reservation, Property 32: Time slot validation
     Validates: Requirements 14.1, 14.3
@@ -70,89 +69,74 @@ def test_property_32_time_slot_validation_rejects_non_full_hour_times(app, start
 
 
 
-from datetime import date, timedelta
-from app.models import Member, Court, Reservation
-from app import db
-import random
-import uuid
-
-
 @given(st.integers(min_value=0, max_value=1))
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_2_two_reservation_limit_allows_under_limit(app, existing_reservations):
+def test_property_2_two_reservation_limit_allows_under_limit(app, example_db, existing_reservations):
     """Feature: tennis-club-reservation, Property 2: Two-reservation limit enforcement
     Validates: Requirements 1.3, 11.3
     
     For any member with fewer than 2 active reservations, creating a new reservation should succeed.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court (created by app fixture)
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
-        # Create test member with unique email
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_{unique_id}_{existing_reservations}@example.com", role="member")
-        member.set_password("password123")
-        db.session.add(member)
-        db.session.commit()
+        # Create test member
+        member = Member(firstname="Test", lastname="Member", email="test@example.com", role="member")
+        member.password_hash = hash_password('password123')
         
-        # Create existing reservations
-        for i in range(existing_reservations):
-            reservation = Reservation(
+        # Create existing reservations, inserted together with the member
+        reservations = [
+            Reservation(
                 court_id=court.id,
                 date=date.today() + timedelta(days=i+1),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
-                booked_for_id=member.id,
-                booked_by_id=member.id,
+                booked_for=member,
+                booked_by=member,
                 status='active'
             )
-            db.session.add(reservation)
+            for i in range(existing_reservations)
+        ]
+        db.session.add_all([member, *reservations])
         db.session.commit()
         
         # Validate member can make another reservation
         result, _ = ValidationService.validate_member_reservation_limit(member.id)
         assert result is True, f"Member with {existing_reservations} reservations should be allowed to book"
-        
-        # Cleanup
-        Reservation.query.filter_by(booked_for_id=member.id).delete()
-        db.session.delete(member)
-        db.session.commit()
 
 
 @given(st.just(2))
-@settings(max_examples=50, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_2_two_reservation_limit_blocks_at_limit(app, _):
+@settings(max_examples=50)
+def test_property_2_two_reservation_limit_blocks_at_limit(app, example_db, _):
     """Feature: tennis-club-reservation, Property 2: Two-reservation limit enforcement
     Validates: Requirements 1.3, 11.3
     
     For any member with 2 active reservations, creating a new reservation should be rejected.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court (created by app fixture)
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
-        # Create test member with unique email
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_limit_{unique_id}@example.com", role="member")
-        member.set_password("password123")
-        db.session.add(member)
-        db.session.commit()
+        # Create test member
+        member = Member(firstname="Test", lastname="Member", email="test_limit@example.com", role="member")
+        member.password_hash = hash_password('password123')
         
-        # Create 2 active reservations (at the limit)
-        for i in range(2):
-            reservation = Reservation(
+        # Create 2 active reservations (at the limit), inserted together with the member
+        reservations = [
+            Reservation(
                 court_id=court.id,
                 date=date.today() + timedelta(days=i+1),
                 start_time=time(10, 0),
                 end_time=time(11, 0),
-                booked_for_id=member.id,
-                booked_by_id=member.id,
+                booked_for=member,
+                booked_by=member,
                 status='active'
             )
-            db.session.add(reservation)
+            for i in range(2)
+        ]
+        db.session.add_all([member, *reservations])
         db.session.commit()
         
         # Validate member cannot make another reservation
@@ -160,42 +144,36 @@ def test_property_2_two_reservation_limit_blocks_at_limit(app, _):
         assert result is False, "Member with 2 reservations should not be allowed to book"
         assert active_sessions is not None, "Active sessions should be returned when limit exceeded"
         assert len(active_sessions) == 2, "Should return 2 active sessions"
-        
-        # Cleanup
-        Reservation.query.filter_by(booked_for_id=member.id).delete()
-        db.session.delete(member)
-        db.session.commit()
 
 
 
 court_numbers = st.integers(min_value=1, max_value=6)
 future_dates = st.dates(min_value=date.today(), max_value=date.today() + timedelta(days=90))
-booking_times = st.times(min_value=time(6, 0), max_value=time(21, 0))
+# Reservations and blocks occupy one-hour slots starting on the full hour, 06:00 to 21:00
+booking_times = st.sampled_from([time(h, 0) for h in range(6, 22)])
 
 
 @given(court_num=court_numbers, booking_date=future_dates, start=booking_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_27_reservation_conflicts_rejected(app, court_num, booking_date, start):
+def test_property_27_reservation_conflicts_rejected(app, example_db, court_num, booking_date, start):
     """Feature: tennis-club-reservation, Property 27: Reservation conflicts are rejected
     Validates: Requirements 11.1, 11.5
     
     For any court and time slot with an existing active reservation, attempts to create 
     another reservation for the same court and time should be rejected.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court (created by app fixture)
         court = Court.query.filter_by(number=court_num).first()
         assert court is not None, f"Court {court_num} should exist"
         
-        # Create test member with unique email
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_{unique_id}_{court_num}_{booking_date}_{start}@example.com", role="member")
-        member.set_password("password123")
+        # Create test member
+        member = Member(firstname="Test", lastname="Member", email="test@example.com", role="member")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Calculate end time
-        end = time(start.hour + 1, start.minute) if start.hour < 21 else time(22, 0)
+        end = time(start.hour + 1, 0)
         
         # Create first reservation
         reservation1 = Reservation(
@@ -213,15 +191,9 @@ def test_property_27_reservation_conflicts_rejected(app, court_num, booking_date
         # Validate that a conflict is detected
         result = ValidationService.validate_no_conflict(court.id, booking_date, start)
         assert result is False, f"Conflict should be detected for court {court_num} on {booking_date} at {start}"
-        
-        # Cleanup
-        db.session.delete(reservation1)
-        db.session.delete(member)
-        db.session.commit()
 
 
 @given(court_num=court_numbers, booking_date=future_dates, start=booking_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_27_no_conflict_when_slot_free(app, court_num, booking_date, start):
     """Feature: tennis-club-reservation, Property 27: Reservation conflicts are rejected
     Validates: Requirements 11.1, 11.5
@@ -239,42 +211,30 @@ def test_property_27_no_conflict_when_slot_free(app, court_num, booking_date, st
 
 
 
-from app.models import Block
-
-
-block_reasons = st.sampled_from(['rain', 'maintenance', 'tournament', 'championship'])
-
-
-@given(court_num=court_numbers, block_date=future_dates, start=booking_times, reason=block_reasons)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_13_blocks_prevent_reservations(app, court_num, block_date, start, reason):
+@given(court_num=court_numbers, block_date=future_dates, start=booking_times)
+def test_property_13_blocks_prevent_reservations(app, example_db, block_reason_ids, court_num, block_date, start):
     """Feature: tennis-club-reservation, Property 13: Blocks prevent new reservations
     Validates: Requirements 5.1, 11.2
     
     For any court and time period with an active block, attempts to create reservations 
     for that court during the blocked period should be rejected.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court (created by app fixture)
         court = Court.query.filter_by(number=court_num).first()
         assert court is not None, f"Court {court_num} should exist"
         
-        # Create test admin with unique email
-        unique_id = random.randint(100000, 999999)
-        admin = Member(firstname="Admin", lastname="Admin", email=f"admin_{unique_id}_{court_num}_{block_date}_{start}@example.com", role="administrator")
-        admin.set_password("password123")
+        # Create test admin
+        admin = Member(firstname="Admin", lastname="Admin", email="admin@example.com", role="administrator")
+        admin.password_hash = hash_password('password123')
         db.session.add(admin)
-        db.session.commit()
+        db.session.flush()
         
-        # Get or create block reason
-        block_reason = BlockReason.query.filter_by(name='Maintenance').first()
-        if not block_reason:
-            block_reason = BlockReason(name='Maintenance', is_active=True, created_by_id=admin.id)
-            db.session.add(block_reason)
-            db.session.commit()
+        # Block reasons are pre-seeded by the app fixture
+        reason_id = block_reason_ids['Maintenance']
         
         # Calculate end time
-        end = time(start.hour + 1, start.minute) if start.hour < 21 else time(22, 0)
+        end = time(start.hour + 1, 0)
         
         # Create block
         block = Block(
@@ -282,7 +242,7 @@ def test_property_13_blocks_prevent_reservations(app, court_num, block_date, sta
             date=block_date,
             start_time=start,
             end_time=end,
-            reason_id=block_reason.id,
+            reason_id=reason_id,
             created_by_id=admin.id
         )
         db.session.add(block)
@@ -291,15 +251,9 @@ def test_property_13_blocks_prevent_reservations(app, court_num, block_date, sta
         # Validate that the block prevents reservations
         result = ValidationService.validate_not_blocked(court.id, block_date, start)
         assert result is False, f"Block should prevent reservation for court {court_num} on {block_date} at {start}"
-        
-        # Cleanup
-        db.session.delete(block)
-        db.session.delete(admin)
-        db.session.commit()
 
 
 @given(court_num=court_numbers, booking_date=future_dates, start=booking_times)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_13_no_block_allows_reservations(app, court_num, booking_date, start):
     """Feature: tennis-club-reservation, Property 13: Blocks prevent new reservations
     Validates: Requirements 5.1, 11.2
@@ -320,10 +274,6 @@ def test_property_13_no_block_allows_reservations(app, court_num, booking_date,
 # SHORT NOTICE BOOKING PROPERTY TESTS
 # ============================================================================
 
-from datetime import datetime, timedelta
-from app.services.reservation_service import ReservationService
-
-
 # Strategies for short notice testing
 minutes_before_start = st.integers(min_value=1, max_value=30)
 short_notice_minutes = st.integers(min_value=1, max_value=15)
@@ -331,7 +281,6 @@ regular_notice_minutes = st.integers(min_value=16, max_value=120)
 
 
 @given(minutes_before=short_notice_minutes)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_40_short_notice_booking_classification(app, minutes_before):
     """Feature: tennis-club-reservation, Property 40: Short notice booking classification
     Validates: Requirements 18.1
@@ -352,7 +301,6 @@ def test_property_40_short_notice_booking_classification(app, minutes_before):
 
 
 @given(minutes_before=regular_notice_minutes)
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 def test_property_40_regular_booking_classification(app, minutes_before):
     """Feature: tennis-club-reservation, Property 40: Short notice booking classification
     Validates: Requirements 18.1
@@ -375,24 +323,22 @@ def test_property_40_regular_booking_classification(app, minutes_before):
 
 
 @given(existing_regular=st.integers(min_value=0, max_value=2))
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_41_short_notice_bookings_excluded_from_limit(app, existing_regular):
+def test_property_41_short_notice_bookings_excluded_from_limit(app, example_db, existing_regular):
     """Feature: tennis-club-reservation, Property 41: Short notice bookings excluded from reservation limit
     Validates: Requirements 18.2, 18.3
     
     Short notice bookings should not count toward the 2-reservation limit.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
         # Create test member
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_short_notice_{unique_id}@example.com", role="member")
-        member.set_password("password123")
+        member = Member(firstname="Test", lastname="Member", email="test_short_notice@example.com", role="member")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Create existing regular reservations
         for i in range(existing_regular):
@@ -432,32 +378,25 @@ def test_property_41_short_notice_bookings_excluded_from_limit(app, existing_reg
         result_regular, _ = ValidationService.validate_member_reservation_limit(member.id, is_short_notice=False)
         expected = existing_regular < 2
         assert result_regular == expected, f"Regular booking should be {'allowed' if expected else 'blocked'} with {existing_regular} existing regular reservations"
-        
-        # Cleanup
-        Reservation.query.filter_by(booked_for_id=member.id).delete()
-        db.session.delete(member)
-        db.session.commit()
 
 
 @given(minutes_until_start=st.integers(min_value=1, max_value=30))
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_46_cancellation_prevented_within_15_minutes(app, minutes_until_start):
+def test_property_46_cancellation_prevented_within_15_minutes(app, example_db, minutes_until_start):
     """Feature: tennis-club-reservation, Property 46: Cancellation prevented within 15 minutes and during slot time
     Validates: Requirements 2.3, 2.4
     
     Reservations cannot be cancelled within 15 minutes of start time or once started.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
         # Create test member
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_cancel_{unique_id}@example.com", role="member")
-        member.set_password("password123")
+        member = Member(firstname="Test", lastname="Member", email="test_cancel@example.com", role="member")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Create reservation
         reservation_date = date.today()
@@ -485,32 +424,26 @@ def test_property_46_cancellation_prevented_within_15_minutes(app, minutes_until
             assert "weniger als 15 Minuten" in error_msg, "Error message should mention 15-minute restriction"
         else:
             assert is_allowed is True, f"Cancellation should be allowed {minutes_until_start} minutes before start"
-        
-        # Cleanup
-        db.session.delete(reservation)
-        db.session.delete(member)
-        db.session.commit()
 
 
 @given(st.just(True))
-@settings(max_examples=50, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_47_short_notice_bookings_cannot_be_cancelled(app, _):
+@settings(max_examples=50)
+def test_property_47_short_notice_bookings_cannot_be_cancelled(app, example_db, _):
     """Feature: tennis-club-reservation, Property 47: Short notice bookings cannot be cancelled
     Validates: Requirements 18.10
     
     Short notice bookings can never be cancelled, regardless of timing.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
         # Create test member
-        unique_id = random.randint(100000, 999999)
-        member = Member(firstname="Test", lastname="Member", email=f"test_short_cancel_{unique_id}@example.com", role="member")
-        member.set_password("password123")
+        member = Member(firstname="Test", lastname="Member", email="test_short_cancel@example.com", role="member")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Create short notice reservation
         reservation_date = date.today() + timedelta(days=1)
@@ -535,16 +468,10 @@ def test_property_47_short_notice_bookings_cannot_be_cancelled(app, _):
         
         assert is_allowed is False, "Short notice bookings should never be cancellable"
         assert "Kurzfristige Buchungen können nicht storniert werden" in error_msg, "Error message should mention short notice restriction"
-        
-        # Cleanup
-        db.session.delete(reservation)
-        db.session.delete(member)
-        db.session.commit()
 
 
 @given(existing_short_notice=st.integers(min_value=0, max_value=1))
-@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
-def test_property_42a_short_notice_booking_limit_enforcement(app, existing_short_notice):
+def test_property_42a_short_notice_booking_limit_enforcement(app, example_db, existing_short_notice):
     """Feature: tennis-club-reservation, Property 42a: Short notice booking limit enforcement
     Validates: Requirements 18.5, 18.6
     
@@ -552,17 +479,16 @@ def test_property_42a_short_notice_booking_limit_enforcement(app, existing_short
     short notice booking should be rejected until the existing short notice booking 
     is completed or cancelled.
     """
-    with app.app_context():
+    with app.app_context(), example_db():
         # Get existing court
         court = Court.query.filter_by(number=1).first()
         assert court is not None, "Court 1 should exist"
         
-        # Create test member with truly unique email using uuid
-        unique_id = uuid.uuid4().hex
-        member = Member(firstname="Test", lastname="Member", email=f"test_short_limit_{unique_id}@example.com", role="member")
-        member.set_password("password123")
+        # Create test member
+        member = Member(firstname="Test", lastname="Member", email="test_short_limit@example.com", role="member")
+        member.password_hash = hash_password('password123')
         db.session.add(member)
-        db.session.commit()
+        db.session.flush()
         
         # Create existing short notice reservations
         for i in range(existing_short_notice):
@@ -622,8 +548,3 @@ def test_property_42a_short_notice_booking_limit_enforcement(app, existing_short
         else:  # existing_short_notice == 1
             assert is_valid is False, "Short notice booking should be blocked when at limit"
             assert "bereits eine aktive kurzfristige Buchung" in error_msg, "Error message should mention short notice limit"
-        
-        # Cleanup
-        Reservation.query.filter_by(booked_for_id=member.id).delete()
-        db.session.delete(member)
-        db.session.commit()
@@ -5,6 +5,7 @@ from app.utils.validators import (
     ValidationError,
     validate_required_fields,
     validate_date_format,
+    parse_date_param,
     validate_time_format,
     validate_integer,
     validate_email_address,
@@ -58,6 +59,23 @@ class TestValidateDateFormat:
             validate_date_format('', 'date')
 
 
+class TestParseDateParam:
+    """Test parse_date_param function."""
+    
+    def test_valid_date(self):
+        """Test valid date string is parsed."""
+        assert parse_date_param('2025-12-05') == date(2025, 12, 5)
+    
+    def test_missing_defaults_to_today(self):
+        """Test missing parameter defaults to today."""
+        assert parse_date_param(None) == date.today()
+    
+    @pytest.mark.parametrize('value', ['05-12-2025', '2025-1-5', '', '2025-02-30', '٢٠٢٥-١٢-٠٥'])
+    def test_invalid_returns_none(self, value):
+        """Test malformed or impossible dates return None."""
+        assert parse_date_param(value) is None
+
+
 class TestValidateTimeFormat:
     """Test validate_time_format function."""
     